@@ -174,7 +174,7 @@ def create_app() -> Flask:
                 g.user_timezone = cached or None  # "" stored as falsy → None
                 return
 
-            profile = supabase_client.get_user_profile(user_id)
+            profile = auth.get_current_profile()  # shared with the template context
             tz = profile.get("timezone") if profile else None
             g.user_timezone = tz
             # Cache in session (store "" for None so we don't re-fetch)
@@ -239,6 +239,11 @@ def create_app() -> Flask:
     app.register_blueprint(guides_bp)
     app.register_blueprint(seo_bp)
 
+    # Blueprints are imported, so safe_referrer_or's redirect whitelist can be
+    # loaded now instead of on the first request that needs it
+    from .utils.validation import _allowed_redirect_prefixes
+    _allowed_redirect_prefixes()
+
     # Add Jinja global for templates that need current date/time
     from datetime import datetime
     app.jinja_env.globals["now"] = lambda: datetime.now()
@@ -95,6 +95,9 @@ class BaseConfig:
     # to re-show the in-app banner for all users.
     LEGAL_LAST_UPDATED = "2026-02-15"
 
+    # Logging: attach a traceback to 1 in N unexpected errors (1 = every error)
+    ERROR_TRACEBACK_SAMPLE_EVERY = int(os.getenv("ERROR_TRACEBACK_SAMPLE_EVERY", "10"))
+
     # Misc
     PREFERRED_URL_SCHEME = os.getenv("PREFERRED_URL_SCHEME", "https")
     SEND_FILE_MAX_AGE_DEFAULT = int(os.getenv("SEND_FILE_MAX_AGE_DEFAULT", "3600"))
@@ -108,6 +111,7 @@ class DevConfig(BaseConfig):
     ENV = "development"
     DEBUG = True
     DEBUG_ENDPOINTS_ENABLED = True  # Enable debug endpoint in development
+    ERROR_TRACEBACK_SAMPLE_EVERY = 1  # Full tracebacks while developing
     TEMPLATES_AUTO_RELOAD = True
     # Disable aggressive static caching in dev
     SEND_FILE_MAX_AGE_DEFAULT = 0
@@ -13,7 +13,7 @@ import hashlib
 from datetime import date
 import json
 from flask import Blueprint, render_template, redirect, url_for, request, flash, session, Response
-from app.utils.auth import require_auth, get_current_user_id
+from app.utils.auth import require_auth, get_current_user_id, get_current_auth_bundle
 from app.extensions import limiter
 from app.services import supabase_client
 from app.services.supabase_client import TIMEZONE_GROUPS
@@ -43,13 +43,15 @@ def index():
     """
     user_id = get_current_user_id()
 
-    # Get user profile and stats
-    profile = supabase_client.get_user_profile(user_id)
+    # Get user profile and plan status (one profile query, reused by the
+    # template context) and stats
+    auth_bundle = get_current_auth_bundle()
+    profile = auth_bundle["profile"]
     plant_count = supabase_client.get_plant_count(user_id)
-    is_premium = supabase_client.is_premium(user_id)
-    is_in_trial = supabase_client.is_in_trial(user_id)
-    trial_days = supabase_client.trial_days_remaining(user_id)
-    has_premium_access = supabase_client.has_premium_access(user_id)
+    is_premium = auth_bundle["is_premium"]
+    is_in_trial = auth_bundle["is_in_trial"]
+    trial_days = auth_bundle["trial_days_remaining"]
+    has_premium_access = auth_bundle["has_premium_access"]
 
     # Get user's plants for carousel (limit 20 for performance)
     latest_plants = supabase_client.get_user_plants(user_id, 20, 0)
@@ -1190,7 +1190,11 @@ def is_premium(user_id: str) -> bool:
     Returns:
         True if premium, False otherwise
     """
-    profile = get_user_profile(user_id)
+    return _profile_is_premium(get_user_profile(user_id))
+
+
+def _profile_is_premium(profile: Optional[Dict[str, Any]]) -> bool:
+    """True if the profile is on the paid premium plan."""
     if not profile:
         return False
 
@@ -1207,20 +1211,37 @@ def is_in_trial(user_id: str) -> bool:
     Returns:
         True if in trial, False otherwise
     """
-    profile = get_user_profile(user_id)
+    return _profile_in_trial(get_user_profile(user_id))
+
+
+def _profile_in_trial(profile: Optional[Dict[str, Any]]) -> bool:
+    """True if the profile's premium trial hasn't ended yet."""
+    return _profile_trial_remaining(profile) is not None
+
+
+def _profile_trial_remaining(profile: Optional[Dict[str, Any]]) -> Optional[timedelta]:
+    """
+    Time left in the profile's premium trial, or None if there is no trial
+    or it has ended. Naive timestamps are treated as UTC; other offsets are
+    converted.
+    """
     if not profile:
-        return False
+        return None
 
     trial_ends_at = profile.get("trial_ends_at")
     if not trial_ends_at:
-        return False
+        return None
 
+    from datetime import timezone
     try:
         trial_end = datetime.fromisoformat(trial_ends_at.replace("Z", "+00:00"))
-        return datetime.utcnow() < trial_end.replace(tzinfo=None)
+        if trial_end.tzinfo is None:
+            trial_end = trial_end.replace(tzinfo=timezone.utc)
+        delta = trial_end - datetime.now(timezone.utc)
     except Exception as e:
         _safe_log_error(f"Error parsing trial date: {e}")
-        return False
+        return None
+    return delta if delta.total_seconds() > 0 else None
 
 
 def trial_days_remaining(user_id: str) -> int:
@@ -1233,21 +1254,8 @@ def trial_days_remaining(user_id: str) -> int:
     Returns:
         Days remaining (0 if trial expired or not in trial)
     """
-    profile = get_user_profile(user_id)
-    if not profile:
-        return 0
-
-    trial_ends_at = profile.get("trial_ends_at")
-    if not trial_ends_at:
-        return 0
-
-    try:
-        trial_end = datetime.fromisoformat(trial_ends_at.replace("Z", "+00:00"))
-        delta = trial_end.replace(tzinfo=None) - datetime.utcnow()
-        return max(0, delta.days)
-    except Exception as e:
-        _safe_log_error(f"Error calculating trial days: {e}")
-        return 0
+    remaining = _profile_trial_remaining(get_user_profile(user_id))
+    return remaining.days if remaining else 0
 
 
 def has_premium_access(user_id: str) -> bool:
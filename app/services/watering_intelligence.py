@@ -6,12 +6,40 @@ intelligent watering recommendations adapted from Universal Watering Logic.
 """
 
 from __future__ import annotations
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import IntEnum
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
+import math
+import re
 
 logger = logging.getLogger(__name__)
 
+# Matches clear/sunny anywhere in the conditions text, without lowercasing it first
+_CLEAR_RE = re.compile(r"clear|sunny", re.IGNORECASE)
+
+
+# Eligibility outcomes once the 48-hour minimum has passed, indexed by
+# recent_rain | rain_expected << 1 | in_skip_window << 2. Earlier flags win,
+# matching the order the conditions are checked in.
+_RECENT_RAIN_REASON = "Recent rain (≥0.25\" in past 48h)"
+_RAIN_EXPECTED_REASON = "Rain expected today/tonight"
+_SKIP_WINDOW_REASON = "In post-rain skip window"
+
+_ELIGIBLE: Tuple[bool, Optional[str]] = (True, None)
+_ELIG_TABLE: Tuple[Tuple[bool, Optional[str]], ...] = tuple(
+    (False, _RECENT_RAIN_REASON) if key & 1
+    else (False, _RAIN_EXPECTED_REASON) if key & 2
+    else (False, _SKIP_WINDOW_REASON) if key & 4
+    else _ELIGIBLE
+    for key in range(8)
+)
+
+_WAIT_REASON_FMT = "Last watered {:.1f}h ago (wait {:.1f}h more)"
+
 
 def check_watering_eligibility(
     hours_since_watered: Optional[float],
@@ -33,24 +61,338 @@ def check_watering_eligibility(
     """
     # First watering always eligible
     if hours_since_watered is None:
-        return True, None
+        return _ELIGIBLE
 
     # Check 48-hour minimum between waterings
     if hours_since_watered < 48:
-        hours_remaining = 48 - hours_since_watered
-        return False, f"Last watered {hours_since_watered:.1f}h ago (wait {hours_remaining:.1f}h more)"
+        return False, _WAIT_REASON_FMT.format(hours_since_watered, 48 - hours_since_watered)
 
     # Check rain conditions
-    if recent_rain:
-        return False, "Recent rain (≥0.25\" in past 48h)"
+    key = (1 if recent_rain else 0) | (2 if rain_expected else 0) | (4 if in_skip_window else 0)
+    return _ELIG_TABLE[key]
+
+
+class PlantKind(IntEnum):
+    """Integer plant categories used inside stress scoring."""
+    HOUSEPLANT = 0
+    OUTDOOR_SHRUB = 1
+    OUTDOOR_WILDFLOWER = 2
+
+
+_PLANT_KINDS: Dict[str, PlantKind] = {
+    "houseplant": PlantKind.HOUSEPLANT,
+    "outdoor_shrub": PlantKind.OUTDOOR_SHRUB,
+    "outdoor_wildflower": PlantKind.OUTDOOR_WILDFLOWER,
+}
+
+
+def _plant_kind(plant_type: str) -> PlantKind:
+    """
+    Resolve a plant_type string to a PlantKind once, at the public boundary.
+
+    Unknown "outdoor*" types score like shrubs (outdoor, not wildflower);
+    anything else scores like a houseplant.
+    """
+    kind = _PLANT_KINDS.get(plant_type)
+    if kind is None:
+        kind = PlantKind.OUTDOOR_SHRUB if plant_type.startswith("outdoor") else PlantKind.HOUSEPLANT
+    return kind
+
+
+# Stress factor flags, in the order factors are reported
+_F_VERY_HOT = 1 << 0
+_F_HOT = 1 << 1
+_F_WARM = 1 << 2
+_F_VERY_WINDY = 1 << 3
+_F_WINDY = 1 << 4
+_F_BREEZY = 1 << 5
+_F_GERMINATION_WIND = 1 << 6
+_F_LONG_DRY_SPELL = 1 << 7
+_F_DRY_SPELL = 1 << 8
+_F_NO_RECENT_RAIN = 1 << 9
+_F_VERY_DRY_AIR = 1 << 10
+_F_DRY_AIR = 1 << 11
+_F_EXTREMELY_LOW_HUMIDITY = 1 << 12
+_F_LOW_HUMIDITY = 1 << 13
+_F_INTENSE_SUN = 1 << 14
+_F_STRONG_SUN = 1 << 15
+_F_SUNNY_WARM = 1 << 16
+_F_GERMINATION_SUN = 1 << 17
+
+# Scoring ladders: bisect_right(thresholds, value) picks the bucket, which
+# indexes the points and factor flag for that rule. Inputs are quantized
+# first (see _quantize), so the strict "wind > 30" rule is the 30.5 bucket
+# edge.
+_HEAT_THRESHOLDS = (82, 88, 92)
+_HEAT_POINTS = (0, 1, 2, 3)
+_HEAT_POINTS_WILDFLOWER = (0, 1, 3, 4)
+_HEAT_FLAGS = (0, _F_WARM, _F_HOT, _F_VERY_HOT)
+
+_WIND_THRESHOLDS = (20, 25, 30.5)
+_WIND_POINTS = (0, 1, 2, 3)
+_WIND_FLAGS = (0, _F_BREEZY, _F_WINDY, _F_VERY_WINDY)
+
+_DRY_SPELL_THRESHOLDS = (120, 168, 240)  # 5, 7, 10 days
+_DRY_SPELL_POINTS = (0, 1, 2, 3)
+_DRY_SPELL_FLAGS = (0, _F_NO_RECENT_RAIN, _F_DRY_SPELL, _F_LONG_DRY_SPELL)
+
+_DEWPOINT_THRESHOLDS = (35, 45)
+_DEWPOINT_POINTS = (2, 1, 0)
+_DEWPOINT_FLAGS = (_F_VERY_DRY_AIR, _F_DRY_AIR, 0)
+
+_HUMIDITY_THRESHOLDS = (15, 25)
+_HUMIDITY_POINTS = (2, 1, 0)
+_HUMIDITY_FLAGS = (_F_EXTREMELY_LOW_HUMIDITY, _F_LOW_HUMIDITY, 0)
+
+# Sun boost reuses the heat thresholds
+_SUN_POINTS = (0, 1, 2, 3)
+_SUN_FLAGS = (0, _F_SUNNY_WARM, _F_STRONG_SUN, _F_INTENSE_SUN)
+
+# Breakdown slots, in the order _score_quantized returns them
+_SLOT_HEAT, _SLOT_WIND, _SLOT_DRY_SPELL, _SLOT_AIR_DRYNESS, _SLOT_SUN_ET = range(5)
+
+# One record per scoring ladder, evaluated in order:
+# (breakdown slot, thresholds, points, wildflower points or None, flags)
+_STRESS_RULES = (
+    (_SLOT_HEAT, _HEAT_THRESHOLDS, _HEAT_POINTS, _HEAT_POINTS_WILDFLOWER, _HEAT_FLAGS),
+    (_SLOT_WIND, _WIND_THRESHOLDS, _WIND_POINTS, None, _WIND_FLAGS),
+    (_SLOT_DRY_SPELL, _DRY_SPELL_THRESHOLDS, _DRY_SPELL_POINTS, None, _DRY_SPELL_FLAGS),
+    (_SLOT_AIR_DRYNESS, _DEWPOINT_THRESHOLDS, _DEWPOINT_POINTS, None, _DEWPOINT_FLAGS),
+    (_SLOT_AIR_DRYNESS, _HUMIDITY_THRESHOLDS, _HUMIDITY_POINTS, None, _HUMIDITY_FLAGS),
+    (_SLOT_SUN_ET, _HEAT_THRESHOLDS, _SUN_POINTS, None, _SUN_FLAGS),
+)
+
+# Stress factor templates (%-formatted; the values are shown as passed in)
+_FMT_VERY_HOT = "very hot (%s°F)"
+_FMT_HOT = "hot (%s°F)"
+_FMT_WARM = "warm (%s°F)"
+_FMT_VERY_WINDY = "very windy (%smph)"
+_FMT_WINDY = "windy (%smph)"
+_FMT_BREEZY = "breezy (%smph)"
+_FMT_LONG_DRY_SPELL = "long dry spell (%.0fd no rain)"
+_FMT_DRY_SPELL = "dry spell (%.0fd no rain)"
+_FMT_NO_RECENT_RAIN = "no recent rain (%.0fd)"
+_FMT_VERY_DRY_AIR = "very dry air (dewpoint %s°F)"
+_FMT_DRY_AIR = "dry air (dewpoint %s°F)"
+_FMT_EXTREMELY_LOW_HUMIDITY = "extremely low humidity (%s%%)"
+_FMT_LOW_HUMIDITY = "low humidity (%s%%)"
+
+# Per flag bit: (template, index of the value it shows in _decode_factors'
+# values tuple, or None for fixed text)
+_TEMP, _WIND, _DAYS, _DEWPOINT, _HUMIDITY = range(5)
+_FACTOR_TEXT: Tuple[Tuple[str, Optional[int]], ...] = (
+    (_FMT_VERY_HOT, _TEMP),
+    (_FMT_HOT, _TEMP),
+    (_FMT_WARM, _TEMP),
+    (_FMT_VERY_WINDY, _WIND),
+    (_FMT_WINDY, _WIND),
+    (_FMT_BREEZY, _WIND),
+    ("germination + wind", None),
+    (_FMT_LONG_DRY_SPELL, _DAYS),
+    (_FMT_DRY_SPELL, _DAYS),
+    (_FMT_NO_RECENT_RAIN, _DAYS),
+    (_FMT_VERY_DRY_AIR, _DEWPOINT),
+    (_FMT_DRY_AIR, _DEWPOINT),
+    (_FMT_EXTREMELY_LOW_HUMIDITY, _HUMIDITY),
+    (_FMT_LOW_HUMIDITY, _HUMIDITY),
+    ("intense sun + heat", None),
+    ("strong sun + heat", None),
+    ("sunny + warm", None),
+    ("germination + sun exposure", None),
+)
+
+
+# Weather fields read by stress scoring and the defaults used when missing
+_WEATHER_KEYS = ("temp_f", "humidity", "wind_mph", "dewpoint", "conditions")
+_WEATHER_DEFAULTS = (70, 50, 0, 50, None)
+
+
+def _weather_inputs(weather: Dict[str, Any]) -> Tuple[Any, Any, Any, Any, bool]:
+    """
+    Extract the weather values used by stress scoring.
+
+    Split out so batch scoring parses a shared weather dict only once.
+
+    Returns:
+        (temp_f, humidity, wind_mph, dewpoint, is_clear)
+    """
+    temp_f, humidity, wind_mph, dewpoint, conditions = map(
+        weather.get, _WEATHER_KEYS, _WEATHER_DEFAULTS
+    )
+    is_clear = _CLEAR_RE.search(conditions or "") is not None
+    return temp_f, humidity, wind_mph, dewpoint, is_clear
+
+
+def _quantize(value: float, low: int, high: int) -> float:
+    """
+    Map value to a cache-friendly stand-in that compares the same way.
+
+    Against any integer threshold in [low, high], the result gives the same
+    answer as value for <, <=, > and >=: integers are kept, values strictly
+    between two integers become the midpoint, and values outside the range
+    are clamped just past it.
+    """
+    if value > high:
+        return high + 0.5
+    if value < low:
+        return low - 0.5
+    whole = math.floor(value)
+    return whole if value == whole else whole + 0.5
+
+
+def _score_kernel(
+    temp_f: Any,
+    humidity: Any,
+    wind_mph: Any,
+    dewpoint: Any,
+    is_clear: bool,
+    hours_since_rain: Optional[float],
+    kind: int,
+    plant_age_weeks: Optional[int]
+) -> Tuple[int, int, int, int, int, int]:
+    """
+    Numeric core of stress scoring.
+
+    Inputs are quantized to the threshold ranges of each rule so plants
+    scored against the same (or nearly the same) weather share one cached
+    result from _score_quantized.
+
+    Returns:
+        (heat, wind, dry_spell, air_dryness, sun_et, factor_mask)
+    """
+    if kind == PlantKind.HOUSEPLANT:
+        # Wind, dry-spell and germination rules never apply indoors: leave
+        # them out of the key so houseplants share entries regardless.
+        return _score_quantized(
+            _quantize(temp_f, 82, 92),
+            _quantize(humidity, 15, 25),
+            0,
+            _quantize(dewpoint, 35, 45),
+            is_clear,
+            None,
+            kind,
+            False
+        )
+
+    return _score_quantized(
+        _quantize(temp_f, 82, 92),
+        _quantize(humidity, 15, 25),
+        _quantize(wind_mph, 15, 30),
+        _quantize(dewpoint, 35, 45),
+        is_clear,
+        None if hours_since_rain is None else _quantize(hours_since_rain, 120, 240),
+        kind,
+        kind == PlantKind.OUTDOOR_WILDFLOWER and bool(plant_age_weeks) and plant_age_weeks <= 4
+    )
+
+
+@lru_cache(maxsize=4096)
+def _score_quantized(
+    temp_f: float,
+    humidity: float,
+    wind_mph: float,
+    dewpoint: float,
+    is_clear: bool,
+    hours_since_rain: Optional[float],
+    kind: int,
+    young: bool
+) -> Tuple[int, int, int, int, int, int]:
+    """
+    Apply the stress rules to quantized inputs (see _score_kernel).
 
-    if rain_expected:
-        return False, "Rain expected today/tonight"
+    Contributing factors are recorded as _F_* bits rather than strings;
+    _decode_factors turns them into text only for callers that need it.
 
-    if in_skip_window:
-        return False, "In post-rain skip window"
+    Returns:
+        (heat, wind, dry_spell, air_dryness, sun_et, factor_mask)
+    """
+    is_outdoor = kind >= PlantKind.OUTDOOR_SHRUB
+    is_wildflower = kind == PlantKind.OUTDOOR_WILDFLOWER
+
+    # Input for each _STRESS_RULES entry; None skips the rule. Wind and
+    # dry-spell only apply outdoors, the sun boost only under clear skies.
+    values = (
+        temp_f,
+        wind_mph if is_outdoor else None,
+        hours_since_rain if is_outdoor else None,
+        dewpoint,
+        humidity,
+        temp_f if is_clear else None,
+    )
 
-    return True, None
+    points = [0, 0, 0, 0, 0]
+    mask = 0
+    for (slot, thresholds, rule_points, wildflower_points, flags), value in zip(_STRESS_RULES, values):
+        if value is None:
+            continue
+        bucket = bisect_right(thresholds, value)
+        if is_wildflower and wildflower_points is not None:
+            rule_points = wildflower_points
+        points[slot] += rule_points[bucket]
+        mask |= flags[bucket]
+
+    # Extra wind and ET sensitivity during germination
+    if is_wildflower and young:
+        if wind_mph > 15:
+            points[_SLOT_WIND] += 1
+            mask |= _F_GERMINATION_WIND
+        if is_clear:
+            points[_SLOT_SUN_ET] += 1
+            mask |= _F_GERMINATION_SUN
+
+    return (*points, mask)
+
+
+def _decode_factors(
+    mask: int,
+    temp_f: Any,
+    humidity: Any,
+    wind_mph: Any,
+    dewpoint: Any,
+    hours_since_rain: Optional[float]
+) -> List[str]:
+    """Turn a factor mask from _score_kernel into display strings, lowest bit first."""
+    factors: List[str] = []
+    if not mask:
+        return factors
+
+    days = hours_since_rain // 24 if hours_since_rain is not None else None
+    values = (temp_f, wind_mph, days, dewpoint, humidity)
+    while mask:
+        bit = mask & -mask
+        template, value_index = _FACTOR_TEXT[bit.bit_length() - 1]
+        factors.append(template if value_index is None else template % values[value_index])
+        mask ^= bit
+    return factors
+
+
+def _score_plant(
+    temp_f: Any,
+    humidity: Any,
+    wind_mph: Any,
+    dewpoint: Any,
+    is_clear: bool,
+    hours_since_rain: Optional[float],
+    plant_type: str,
+    plant_age_weeks: Optional[int]
+) -> Dict[str, Any]:
+    """Score one plant against pre-extracted weather values (see calculate_stress_score)."""
+    heat, wind, dry_spell, air_dryness, sun_et, mask = _score_kernel(
+        temp_f, humidity, wind_mph, dewpoint, is_clear,
+        hours_since_rain, _plant_kind(plant_type), plant_age_weeks
+    )
+
+    return {
+        "total_score": heat + wind + dry_spell + air_dryness + sun_et,
+        "factors": _decode_factors(mask, temp_f, humidity, wind_mph, dewpoint, hours_since_rain),
+        "breakdown": {
+            "heat": heat,
+            "wind": wind,
+            "dry_spell": dry_spell,
+            "air_dryness": air_dryness,
+            "sun_et": sun_et
+        }
+    }
 
 
 def calculate_stress_score(
@@ -77,139 +419,81 @@ def calculate_stress_score(
             "breakdown": Dict[str, int]  # Score breakdown by category
         }
     """
-    score = 0
-    factors = []
-    breakdown = {
-        "heat": 0,
-        "wind": 0,
-        "dry_spell": 0,
-        "air_dryness": 0,
-        "sun_et": 0
-    }
+    return _score_plant(
+        *_weather_inputs(weather),
+        hours_since_rain=hours_since_rain,
+        plant_type=plant_type,
+        plant_age_weeks=plant_age_weeks
+    )
 
-    temp_f = weather.get("temp_f", 70)
-    humidity = weather.get("humidity", 50)
-    wind_mph = weather.get("wind_mph", 0)
-    dewpoint = weather.get("dewpoint", 50)
-    conditions = (weather.get("conditions") or "").lower()
-
-    is_clear = any(word in conditions for word in ["clear", "sunny"])
-    is_wildflower = plant_type == "outdoor_wildflower"
-    is_germination = is_wildflower and plant_age_weeks and plant_age_weeks <= 4
-
-    # HEAT STRESS
-    if temp_f >= 92:
-        heat_points = 4 if is_wildflower else 3
-        score += heat_points
-        breakdown["heat"] = heat_points
-        factors.append(f"very hot ({temp_f}°F)")
-    elif temp_f >= 88:
-        heat_points = 3 if is_wildflower else 2
-        score += heat_points
-        breakdown["heat"] = heat_points
-        factors.append(f"hot ({temp_f}°F)")
-    elif temp_f >= 82:
-        heat_points = 1
-        score += heat_points
-        breakdown["heat"] = heat_points
-        factors.append(f"warm ({temp_f}°F)")
-
-    # WIND STRESS (primarily for outdoor plants)
-    if plant_type.startswith("outdoor"):
-        if wind_mph > 30:
-            wind_points = 3
-            score += wind_points
-            breakdown["wind"] = wind_points
-            factors.append(f"very windy ({wind_mph}mph)")
-        elif wind_mph >= 25:
-            wind_points = 2
-            score += wind_points
-            breakdown["wind"] = wind_points
-            factors.append(f"windy ({wind_mph}mph)")
-        elif wind_mph >= 20:
-            wind_points = 1
-            score += wind_points
-            breakdown["wind"] = wind_points
-            factors.append(f"breezy ({wind_mph}mph)")
-
-        # Extra wind sensitivity during germination
-        if is_germination and wind_mph > 15:
-            score += 1
-            breakdown["wind"] += 1
-            factors.append("germination + wind")
-
-    # DRY-SPELL (for outdoor plants with rain tracking)
-    if plant_type.startswith("outdoor") and hours_since_rain is not None:
-        if hours_since_rain >= 240:  # 10 days
-            dry_points = 3
-            score += dry_points
-            breakdown["dry_spell"] = dry_points
-            factors.append(f"long dry spell ({hours_since_rain//24:.0f}d no rain)")
-        elif hours_since_rain >= 168:  # 7 days
-            dry_points = 2
-            score += dry_points
-            breakdown["dry_spell"] = dry_points
-            factors.append(f"dry spell ({hours_since_rain//24:.0f}d no rain)")
-        elif hours_since_rain >= 120:  # 5 days
-            dry_points = 1
-            score += dry_points
-            breakdown["dry_spell"] = dry_points
-            factors.append(f"no recent rain ({hours_since_rain//24:.0f}d)")
-
-    # AIR DRYNESS
-    if dewpoint < 35:
-        dry_points = 2
-        score += dry_points
-        breakdown["air_dryness"] = dry_points
-        factors.append(f"very dry air (dewpoint {dewpoint}°F)")
-    elif dewpoint < 45:
-        dry_points = 1
-        score += dry_points
-        breakdown["air_dryness"] = dry_points
-        factors.append(f"dry air (dewpoint {dewpoint}°F)")
-
-    if humidity < 15:
-        dry_points = 2
-        score += dry_points
-        breakdown["air_dryness"] += dry_points
-        factors.append(f"extremely low humidity ({humidity}%)")
-    elif humidity < 25:
-        dry_points = 1
-        score += dry_points
-        breakdown["air_dryness"] += dry_points
-        factors.append(f"low humidity ({humidity}%)")
-
-    # SUN / EVAPOTRANSPIRATION BOOST
-    if is_clear:
-        if temp_f >= 92:
-            et_points = 3
-            score += et_points
-            breakdown["sun_et"] = et_points
-            factors.append("intense sun + heat")
-        elif temp_f >= 88:
-            et_points = 2
-            score += et_points
-            breakdown["sun_et"] = et_points
-            factors.append("strong sun + heat")
-        elif temp_f >= 82:
-            et_points = 1
-            score += et_points
-            breakdown["sun_et"] = et_points
-            factors.append("sunny + warm")
-
-        # Extra ET sensitivity during germination
-        if is_germination:
-            score += 1
-            breakdown["sun_et"] += 1
-            factors.append("germination + sun exposure")
 
-    return {
-        "total_score": score,
-        "factors": factors,
-        "breakdown": breakdown
-    }
+def batch_calculate_stress_scores(
+    weather: Dict[str, Any],
+    plants: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Calculate stress scores for several plants sharing the same weather.
+
+    Weather values are extracted once for the whole batch instead of once
+    per plant.
+
+    Args:
+        weather: Weather dict with temp_f, humidity, wind_mph, conditions, dewpoint
+        plants: Dicts with optional plant_type, plant_age_weeks, hours_since_rain
+
+    Returns:
+        List of calculate_stress_score results, in the same order as plants
+    """
+    weather_inputs = _weather_inputs(weather)
+    return [
+        _score_plant(
+            *weather_inputs,
+            hours_since_rain=p.get("hours_since_rain"),
+            plant_type=p.get("plant_type") or "houseplant",
+            plant_age_weeks=p.get("plant_age_weeks")
+        )
+        for p in plants
+    ]
+
+
+def batch_calculate_stress_totals(
+    weather: Dict[str, Any],
+    plants: List[Dict[str, Any]]
+) -> List[int]:
+    """
+    Score-only variant of batch_calculate_stress_scores.
 
+    Skips factor strings and breakdown dicts, for recomputes that only need
+    the total stress score per plant.
 
+    Args:
+        weather: Weather dict with temp_f, humidity, wind_mph, conditions, dewpoint
+        plants: Dicts with optional plant_type, plant_age_weeks, hours_since_rain
+
+    Returns:
+        Total stress score per plant, in the same order as plants
+    """
+    weather_inputs = _weather_inputs(weather)
+    return [
+        sum(_score_kernel(
+            *weather_inputs,
+            hours_since_rain=p.get("hours_since_rain"),
+            kind=_plant_kind(p.get("plant_type") or "houseplant"),
+            plant_age_weeks=p.get("plant_age_weeks")
+        )[:-1])  # drop the factor mask
+        for p in plants
+    ]
+
+
+# (threshold, explanation) per watering rule; explanations are shared by
+# every cached recommendation
+_WILDFLOWER_GERMINATION_RULE = (2, "wildflower threshold: 2")  # germination phase
+_WILDFLOWER_RULE = (3, "wildflower threshold: 3")  # established
+_SHRUB_RULE = (2, "shrub threshold: 2")
+_HOUSEPLANT_RULE = (2, "houseplant threshold: 2")  # conservative
+
+
+@lru_cache(maxsize=256)
 def determine_watering_recommendation(
     stress_score: int,
     plant_type: str = "houseplant",
@@ -218,6 +502,8 @@ def determine_watering_recommendation(
     """
     Determine whether to water based on stress score and plant type.
 
+    Pure function of its arguments, so results are memoized.
+
     Args:
         stress_score: Total environmental stress score
         plant_type: "houseplant", "outdoor_shrub", "outdoor_wildflower"
@@ -228,29 +514,49 @@ def determine_watering_recommendation(
     """
     if plant_type == "outdoor_wildflower":
         if plant_age_weeks and plant_age_weeks <= 3:
-            # Germination phase: water if score ≥ 2
-            should_water = stress_score >= 2
-            threshold = 2
+            threshold, explanation = _WILDFLOWER_GERMINATION_RULE
         else:
-            # Established: water if score ≥ 3
-            should_water = stress_score >= 3
-            threshold = 3
-        explanation = f"wildflower threshold: {threshold}"
+            threshold, explanation = _WILDFLOWER_RULE
     elif plant_type == "outdoor_shrub":
-        # Shrubs: water if score ≥ 2
-        should_water = stress_score >= 2
-        threshold = 2
-        explanation = f"shrub threshold: {threshold}"
+        threshold, explanation = _SHRUB_RULE
     else:
-        # Houseplants: conservative threshold of ≥ 2
-        should_water = stress_score >= 2
-        threshold = 2
-        explanation = f"houseplant threshold: {threshold}"
+        threshold, explanation = _HOUSEPLANT_RULE
 
-    return should_water, explanation
+    return stress_score >= threshold, explanation
 
 
-def generate_watering_recommendation(
+@dataclass(frozen=True, slots=True)
+class WateringDecision:
+    """
+    Watering recommendation for one plant.
+
+    Slotted, immutable counterpart of the dict returned by
+    generate_watering_recommendation, for callers that keep decisions around
+    (e.g. scoring every plant in a garden). Convert with as_dict() at the
+    JSON/template boundary.
+    """
+    should_water: bool
+    recommendation: str
+    reason: Optional[str]
+    stress_score: int
+    stress_factors: Tuple[str, ...]
+    eligible: bool
+    eligibility_reason: Optional[str]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the dict shape produced by generate_watering_recommendation."""
+        return {
+            "should_water": self.should_water,
+            "recommendation": self.recommendation,
+            "reason": self.reason,
+            "stress_score": self.stress_score,
+            "stress_factors": list(self.stress_factors),
+            "eligible": self.eligible,
+            "eligibility_reason": self.eligibility_reason
+        }
+
+
+def generate_watering_decision(
     plant_name: str,
     hours_since_watered: Optional[float],
     weather: Optional[Dict[str, Any]],
@@ -259,33 +565,35 @@ def generate_watering_recommendation(
     hours_since_rain: Optional[float] = None,
     recent_rain: bool = False,
     rain_expected: bool = False
-) -> Dict[str, Any]:
+) -> WateringDecision:
     """
-    Generate complete watering recommendation for a plant.
+    Generate a watering recommendation as a WateringDecision.
 
-    This is the main entry point for watering intelligence.
+    Takes the same arguments as generate_watering_recommendation.
+    """
+    return _decide(
+        plant_name=plant_name,
+        hours_since_watered=hours_since_watered,
+        weather_inputs=_weather_inputs(weather) if weather else None,
+        plant_type=plant_type,
+        plant_age_weeks=plant_age_weeks,
+        hours_since_rain=hours_since_rain,
+        recent_rain=recent_rain,
+        rain_expected=rain_expected
+    )
 
-    Args:
-        plant_name: Plant's display name
-        hours_since_watered: Hours since last watering (None if never watered)
-        weather: Current weather data
-        plant_type: "houseplant", "outdoor_shrub", "outdoor_wildflower"
-        plant_age_weeks: Plant age in weeks (for wildflowers)
-        hours_since_rain: Hours since last ≥0.25" rain (for outdoor plants)
-        recent_rain: Whether ≥0.25" rain in past 48 hours
-        rain_expected: Whether ≥0.25" rain expected today/tonight
 
-    Returns:
-        {
-            "should_water": bool,
-            "recommendation": str,  # Human-readable recommendation
-            "reason": str,  # Brief explanation
-            "stress_score": int,
-            "stress_factors": List[str],
-            "eligible": bool,
-            "eligibility_reason": Optional[str]
-        }
-    """
+def _decide(
+    plant_name: str,
+    hours_since_watered: Optional[float],
+    weather_inputs: Optional[Tuple[Any, Any, Any, Any, bool]],
+    plant_type: str,
+    plant_age_weeks: Optional[int],
+    hours_since_rain: Optional[float],
+    recent_rain: bool,
+    rain_expected: bool
+) -> WateringDecision:
+    """Build a WateringDecision from pre-extracted weather values (None if no weather)."""
     # Check eligibility first
     is_eligible, eligibility_reason = check_watering_eligibility(
         hours_since_watered=hours_since_watered,
@@ -295,60 +603,63 @@ def generate_watering_recommendation(
     )
 
     if not is_eligible:
-        return {
-            "should_water": False,
-            "recommendation": f"💧 {plant_name}: NOT YET",
-            "reason": eligibility_reason,
-            "stress_score": 0,
-            "stress_factors": [],
-            "eligible": False,
-            "eligibility_reason": eligibility_reason
-        }
+        return WateringDecision(
+            should_water=False,
+            recommendation=f"💧 {plant_name}: NOT YET",
+            reason=eligibility_reason,
+            stress_score=0,
+            stress_factors=(),
+            eligible=False,
+            eligibility_reason=eligibility_reason
+        )
 
     # Calculate stress score (only if eligible)
-    if not weather:
+    if weather_inputs is None:
         # No weather data - fall back to simple time-based recommendation
         if hours_since_watered is None:
-            return {
-                "should_water": True,
-                "recommendation": f"💧 {plant_name}: CHECK SOIL",
-                "reason": "Never watered - check soil moisture",
-                "stress_score": 0,
-                "stress_factors": ["no watering history"],
-                "eligible": True,
-                "eligibility_reason": None
-            }
+            return WateringDecision(
+                should_water=True,
+                recommendation=f"💧 {plant_name}: CHECK SOIL",
+                reason="Never watered - check soil moisture",
+                stress_score=0,
+                stress_factors=("no watering history",),
+                eligible=True,
+                eligibility_reason=None
+            )
         elif hours_since_watered >= 168:  # 7 days
-            return {
-                "should_water": True,
-                "recommendation": f"💧 {plant_name}: LIKELY YES",
-                "reason": f"Last watered {hours_since_watered//24:.0f} days ago",
-                "stress_score": 0,
-                "stress_factors": ["long time since watering"],
-                "eligible": True,
-                "eligibility_reason": None
-            }
+            return WateringDecision(
+                should_water=True,
+                recommendation=f"💧 {plant_name}: LIKELY YES",
+                reason=f"Last watered {hours_since_watered//24:.0f} days ago",
+                stress_score=0,
+                stress_factors=("long time since watering",),
+                eligible=True,
+                eligibility_reason=None
+            )
         else:
-            return {
-                "should_water": False,
-                "recommendation": f"💧 {plant_name}: PROBABLY NOT",
-                "reason": f"Watered {hours_since_watered//24:.0f} days ago - check soil",
-                "stress_score": 0,
-                "stress_factors": [],
-                "eligible": True,
-                "eligibility_reason": None
-            }
-
-    # Calculate stress with weather data
-    stress_result = calculate_stress_score(
-        weather=weather,
+            return WateringDecision(
+                should_water=False,
+                recommendation=f"💧 {plant_name}: PROBABLY NOT",
+                reason=f"Watered {hours_since_watered//24:.0f} days ago - check soil",
+                stress_score=0,
+                stress_factors=(),
+                eligible=True,
+                eligibility_reason=None
+            )
+
+    # Calculate stress with weather data. Calls the kernel directly: the
+    # per-category breakdown from calculate_stress_score is not needed here.
+    temp_f, humidity, wind_mph, dewpoint, is_clear = weather_inputs
+    *points, factor_mask = _score_kernel(
+        temp_f, humidity, wind_mph, dewpoint, is_clear,
         hours_since_rain=hours_since_rain,
-        plant_type=plant_type,
+        kind=_plant_kind(plant_type),
         plant_age_weeks=plant_age_weeks
     )
-
-    stress_score = stress_result["total_score"]
-    stress_factors = stress_result["factors"]
+    stress_score = sum(points)
+    stress_factors = _decode_factors(
+        factor_mask, temp_f, humidity, wind_mph, dewpoint, hours_since_rain
+    )
 
     # Determine recommendation
     should_water, threshold_explanation = determine_watering_recommendation(
@@ -370,15 +681,98 @@ def generate_watering_recommendation(
         else:
             reason = f"Stress score {stress_score} (below threshold: {threshold_explanation})"
 
-    return {
-        "should_water": should_water,
-        "recommendation": recommendation,
-        "reason": reason,
-        "stress_score": stress_score,
-        "stress_factors": stress_factors,
-        "eligible": True,
-        "eligibility_reason": None
-    }
+    return WateringDecision(
+        should_water=should_water,
+        recommendation=recommendation,
+        reason=reason,
+        stress_score=stress_score,
+        stress_factors=tuple(stress_factors),
+        eligible=True,
+        eligibility_reason=None
+    )
+
+
+def generate_watering_recommendation(
+    plant_name: str,
+    hours_since_watered: Optional[float],
+    weather: Optional[Dict[str, Any]],
+    plant_type: str = "houseplant",
+    plant_age_weeks: Optional[int] = None,
+    hours_since_rain: Optional[float] = None,
+    recent_rain: bool = False,
+    rain_expected: bool = False
+) -> Dict[str, Any]:
+    """
+    Generate complete watering recommendation for a plant.
+
+    This is the main entry point for watering intelligence.
+
+    Args:
+        plant_name: Plant's display name
+        hours_since_watered: Hours since last watering (None if never watered)
+        weather: Current weather data
+        plant_type: "houseplant", "outdoor_shrub", "outdoor_wildflower"
+        plant_age_weeks: Plant age in weeks (for wildflowers)
+        hours_since_rain: Hours since last ≥0.25" rain (for outdoor plants)
+        recent_rain: Whether ≥0.25" rain in past 48 hours
+        rain_expected: Whether ≥0.25" rain expected today/tonight
+
+    Returns:
+        {
+            "should_water": bool,
+            "recommendation": str,  # Human-readable recommendation
+            "reason": str,  # Brief explanation
+            "stress_score": int,
+            "stress_factors": List[str],
+            "eligible": bool,
+            "eligibility_reason": Optional[str]
+        }
+    """
+    return generate_watering_decision(
+        plant_name=plant_name,
+        hours_since_watered=hours_since_watered,
+        weather=weather,
+        plant_type=plant_type,
+        plant_age_weeks=plant_age_weeks,
+        hours_since_rain=hours_since_rain,
+        recent_rain=recent_rain,
+        rain_expected=rain_expected
+    ).as_dict()
+
+
+def generate_watering_recommendations_bulk(
+    plants: List[Dict[str, Any]],
+    weather: Optional[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Generate watering recommendations for several plants sharing one weather dict.
+
+    Equivalent to calling generate_watering_recommendation per plant, but the
+    weather is parsed once for the whole batch.
+
+    Args:
+        plants: Dicts with plant_name and optional hours_since_watered,
+            plant_type, plant_age_weeks, hours_since_rain, recent_rain,
+            rain_expected (same meaning as generate_watering_recommendation)
+        weather: Current weather data
+
+    Returns:
+        List of generate_watering_recommendation results, in the same order as plants
+    """
+    weather_inputs = _weather_inputs(weather) if weather else None
+    return [
+        _decide(
+            plant_name=p.get("plant_name") or "Your plant",
+            hours_since_watered=p.get("hours_since_watered"),
+            weather_inputs=weather_inputs,
+            plant_type=p.get("plant_type") or "houseplant",
+            plant_age_weeks=p.get("plant_age_weeks"),
+            hours_since_rain=p.get("hours_since_rain"),
+            recent_rain=bool(p.get("recent_rain")),
+            rain_expected=bool(p.get("rain_expected"))
+        ).as_dict()
+        for p in plants
+    ]
 
 
 def get_watering_instructions(
@@ -395,20 +789,30 @@ def get_watering_instructions(
     Returns:
         Human-readable watering instructions
     """
+    windy = humid = False
+    if weather and plant_type == "outdoor_wildflower":
+        windy = weather.get("wind_mph", 0) >= 12
+        humid = weather.get("dewpoint", 50) >= 65
+    return _watering_instructions(plant_type, windy, humid)
+
+
+@lru_cache(maxsize=32)
+def _watering_instructions(plant_type: str, windy: bool, humid: bool) -> str:
+    """
+    Build instructions for a plant type and the two weather buckets that matter.
+
+    Only a handful of distinct strings exist, so they are cached.
+    """
     if plant_type == "houseplant":
         return "Water thoroughly until drainage, then allow top 1-2\" to dry before next watering."
 
     if plant_type == "outdoor_wildflower":
         base = "AM: 5-10 min fine soak at soil level. PM: 2-5 min only if windy/hot."
-        if weather:
-            wind_mph = weather.get("wind_mph", 0)
-            dewpoint = weather.get("dewpoint", 50)
-
-            if wind_mph >= 12:
-                base += " PM mulch check & 2-3 min root-zone top-off recommended."
+        if windy:
+            base += " PM mulch check & 2-3 min root-zone top-off recommended."
 
-            if dewpoint >= 65:
-                base += " Check for 'pinched' seedlings; let surface dry between waterings."
+        if humid:
+            base += " Check for 'pinched' seedlings; let surface dry between waterings."
         return base
 
     if plant_type == "outdoor_shrub":
@@ -16,16 +16,29 @@ Notes:
 """
 
 from __future__ import annotations
+import json
 import os
+import threading
 import time
+from bisect import bisect_right
 from functools import lru_cache, wraps
+from itertools import islice
 from typing import Optional, Dict, List
 import re
+import sqlite3
 import requests
-from datetime import datetime, timezone, timedelta
-from collections import defaultdict, Counter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
+from collections import Counter, OrderedDict, deque
 from flask import current_app, has_app_context
 
+# Optional faster JSON decoder for forecast payloads (falls back to stdlib)
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 
 # ============================================================================
 # OPENWEATHER API RATE LIMITS & CACHING
@@ -38,13 +51,88 @@ OPENWEATHER_FREE_TIER_RPM = 60      # Free tier: 60 requests per minute
 OPENWEATHER_CACHE_TTL = 600         # 10 minutes - weather doesn't change fast
 OPENWEATHER_CACHE_MAX_CITIES = 64   # Max cached cities per function
 
-# Cache storage: {func_name: {cache_key: (timestamp, value)}}
-_weather_cache: Dict[str, Dict[tuple, tuple]] = {}
+# Client-side guard for the free-tier limit: timestamps of upstream calls in
+# the last minute, shared by every helper in this process.
+_call_times: deque = deque()
+_rate_lock = threading.Lock()
+
+
+class _RateState(threading.local):
+    """Per-thread count of upstream calls the limiter has refused."""
+    refusals = 0
+
+
+_rate_state = _RateState()
+
+
+def _take_call_slot() -> bool:
+    """Claim one upstream call in the rolling minute; False if over budget."""
+    with _rate_lock:
+        current_time = time.time()
+        while _call_times and current_time - _call_times[0] >= 60:
+            _call_times.popleft()
+        if len(_call_times) >= OPENWEATHER_FREE_TIER_RPM:
+            _rate_state.refusals += 1
+            return False
+        _call_times.append(current_time)
+        return True
+
+
+class _BudgetedRetry(Retry):
+    """Retry whose retries take limiter slots too; out of budget, it gives up."""
+
+    def increment(self, *args, **kwargs):
+        retry = super().increment(*args, **kwargs)  # raises once exhausted
+        if not _take_call_slot():
+            return self.new(total=0).increment(*args, **kwargs)
+        return retry
+
+
+# Shared HTTP session: reuses pooled connections (no TCP/TLS handshake per
+# cache miss) and retries transient upstream errors before giving up.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=_BudgetedRetry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+))
+
+
+def _rate_limited_get(url: str, **kwargs) -> requests.Response:
+    """
+    GET through the shared session, allowing at most OPENWEATHER_FREE_TIER_RPM
+    calls (retries included) per rolling minute.
+
+    Over budget it raises rather than sleeping, so a cold cache never stalls a
+    page for up to a minute; callers already treat any exception as
+    "weather unavailable" and return None. The refusal is counted in
+    _rate_state so ttl_cache doesn't store that None for a whole TTL.
+    """
+    if not _take_call_slot():
+        raise requests.RequestException("OpenWeather rate limit reached; skipping request")
+    return _SESSION.get(url, **kwargs)
+
+
+# Cache storage: {func_name: OrderedDict{cache_key: (timestamp, value, hits)}}
+# Each OrderedDict is kept in least- to most-recently-used order.
+_weather_cache: Dict[str, OrderedDict] = {}
+
+# One lock per cached function, guarding every read/write of its OrderedDict
+# (hits reorder it, so even lookups mutate). Never held across an API call.
+_weather_cache_locks: Dict[str, threading.Lock] = {}
+
+# Misses currently being fetched: {(func_name, cache_key): Event set when done}.
+# Concurrent misses on the same key wait for the first fetch instead of each
+# calling the API (keeps a burst of dashboard loads to one upstream request).
+_inflight: Dict[tuple, threading.Event] = {}
+_inflight_lock = threading.Lock()
 
 
 def clear_weather_cache():
-    """Clear all weather API caches. Useful for testing."""
+    """Clear all weather API caches (and the resolved API key). Useful for testing."""
+    global _api_key
     _weather_cache.clear()
+    _api_key = None
 
 
 def get_cache_stats() -> Dict[str, any]:
@@ -74,22 +162,30 @@ def get_cache_stats() -> Dict[str, any]:
 
     oldest_time = None
     newest_time = None
+    cached_cities = stats["cached_cities"]
+
+    for func_name, cache in list(_weather_cache.items()):
+        # Snapshot under the function's lock; other threads reorder on hits
+        with _weather_cache_locks[func_name]:
+            times = [entry[0] for entry in cache.values()]
+            keys = list(cache)
 
-    for func_name, cache in _weather_cache.items():
-        stats["by_function"][func_name] = len(cache)
-        stats["total_entries"] += len(cache)
+        stats["by_function"][func_name] = len(times)
+        stats["total_entries"] += len(times)
+        if not times:
+            continue
 
-        for cache_key, (cached_time, _) in cache.items():
-            # Track oldest/newest
-            if oldest_time is None or cached_time < oldest_time:
-                oldest_time = cached_time
-            if newest_time is None or cached_time > newest_time:
-                newest_time = cached_time
+        # Entries are kept in recency order, not age order, so scan the
+        # timestamps (min/max run in C over one list per function)
+        oldest = min(times)
+        newest = max(times)
+        if oldest_time is None or oldest < oldest_time:
+            oldest_time = oldest
+        if newest_time is None or newest > newest_time:
+            newest_time = newest
 
-            # Extract city from cache key if possible
-            args = cache_key[0]
-            if args and isinstance(args[0], str):
-                stats["cached_cities"].add(args[0])
+        # Extract city from cache key (first positional arg) if possible
+        cached_cities.update(args[0] for args, _ in keys if args and isinstance(args[0], str))
 
     if oldest_time:
         stats["oldest_entry_age"] = round(current_time - oldest_time)
@@ -102,6 +198,20 @@ def get_cache_stats() -> Dict[str, any]:
     return stats
 
 
+def _evict_least_valuable(cache: OrderedDict) -> None:
+    """
+    Evict the least-hit entry among the least recently used 10% of cache.
+
+    Plain LRU would drop frequently reused entries (e.g. coordinates, hit
+    by every forecast helper) just as readily as one-off lookups; weighting
+    the recency tail by hit count keeps the popular ones. Ties go to the
+    least recently used entry. Caller holds the cache's lock.
+    """
+    tail = islice(cache.items(), max(1, len(cache) // 10))
+    victim = min(tail, key=lambda item: item[1][2])[0]
+    del cache[victim]
+
+
 def ttl_cache(seconds: int = OPENWEATHER_CACHE_TTL, maxsize: int = OPENWEATHER_CACHE_MAX_CITIES):
     """
     Simple TTL cache decorator for weather API calls.
@@ -115,40 +225,86 @@ def ttl_cache(seconds: int = OPENWEATHER_CACHE_TTL, maxsize: int = OPENWEATHER_C
     """
     def decorator(func):
         cache_name = func.__name__
+        lock = _weather_cache_locks.setdefault(cache_name, threading.Lock())
+        now = time.time
 
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Create cache key from args and kwargs
             cache_key = (args, tuple(sorted(kwargs.items())))
 
-            # Initialize cache for this function if needed
-            if cache_name not in _weather_cache:
-                _weather_cache[cache_name] = {}
-
-            cache = _weather_cache[cache_name]
-            current_time = time.time()
-
-            # Check if we have a valid cached value
-            if cache_key in cache:
-                cached_time, cached_value = cache[cache_key]
-                if current_time - cached_time < seconds:
-                    return cached_value
-
-            # Call the actual function
-            result = func(*args, **kwargs)
-
-            # Store in cache (evict oldest if at max size)
-            if len(cache) >= maxsize:
-                # Remove oldest entry
-                oldest_key = min(cache.keys(), key=lambda k: cache[k][0])
-                del cache[oldest_key]
-
-            cache[cache_key] = (current_time, result)
+            current_time = now()
+
+            with lock:
+                # Initialize cache for this function if needed
+                cache = _weather_cache.get(cache_name)
+                if cache is None:
+                    cache = _weather_cache[cache_name] = OrderedDict()
+
+                # Check if we have a valid cached value
+                try:
+                    cached_time, cached_value, hits = cache[cache_key]
+                except KeyError:
+                    pass
+                else:
+                    if current_time - cached_time < seconds:
+                        cache[cache_key] = (cached_time, cached_value, hits + 1)
+                        cache.move_to_end(cache_key)
+                        return cached_value
+
+            # Single-flight: only one caller per key fetches; the rest wait for
+            # its result (and fetch themselves only if it failed or timed out)
+            flight_key = (cache_name, cache_key)
+            with _inflight_lock:
+                event = _inflight.get(flight_key)
+                leader = event is None
+                if leader:
+                    event = _inflight[flight_key] = threading.Event()
+
+            if not leader:
+                event.wait(timeout=8)
+                with lock:
+                    entry = cache.get(cache_key)
+                if entry is not None and now() - entry[0] < seconds:
+                    return entry[1]
+
+            # Call the actual function and store the result before waking any
+            # waiters (at max size, drop expired entries first and only evict
+            # a live entry if that frees nothing)
+            try:
+                refusals = _rate_state.refusals
+                result = func(*args, **kwargs)
+
+                # A result shaped by the rate limiter refusing a call (here or
+                # in a nested cached helper) only reflects our own budget, which
+                # frees up within a minute: return it but don't cache it
+                if _rate_state.refusals != refusals:
+                    return result
+
+                with lock:
+                    if cache_key in cache:
+                        cache.move_to_end(cache_key)
+                    elif len(cache) >= maxsize:
+                        # Recency order isn't age order, so check every entry; this
+                        # only runs when the cache is full (at most maxsize entries)
+                        expired = [k for k, (t, _, _) in cache.items() if current_time - t >= seconds]
+                        for k in expired:
+                            del cache[k]
+                        if len(cache) >= maxsize:
+                            _evict_least_valuable(cache)
+
+                    cache[cache_key] = (current_time, result, 0)
+            finally:
+                if leader:
+                    with _inflight_lock:
+                        del _inflight[flight_key]
+                    event.set()
             return result
 
         def cache_clear():
-            if cache_name in _weather_cache:
-                _weather_cache[cache_name].clear()
+            with lock:
+                if cache_name in _weather_cache:
+                    _weather_cache[cache_name].clear()
 
         wrapper.cache_clear = cache_clear
         return wrapper
@@ -156,7 +312,7 @@ def ttl_cache(seconds: int = OPENWEATHER_CACHE_TTL, maxsize: int = OPENWEATHER_C
 
 
 _US_STATE_LIKE = re.compile(r"^([^,]+),\s?([A-Za-z]{2})$")
-_US_ZIP = re.compile(r"^\s*(\d{5})(?:-\d{4})?\s*$")
+_US_ZIP = re.compile(r"(\d{5})(?:-\d{4})?")  # use fullmatch() on stripped input
 
 # Hawaiian island names mapped to their main towns (for OpenWeather API compatibility)
 _HAWAIIAN_ISLANDS = {
@@ -169,32 +325,48 @@ _HAWAIIAN_ISLANDS = {
     "oahu": "Honolulu",
 }
 
+@lru_cache(maxsize=512)  # Same few cities are normalized on every cache miss
 def _normalize_city_query(city: str) -> str:
     city = city.strip()
+    if "," not in city:  # Bare names can't be "City, ST"; skip the regex
+        return city
     m = _US_STATE_LIKE.match(city)
     if m:
         city_part = m.group(1).strip()
         state = m.group(2).upper()
         # Map Hawaiian island names to their main towns
-        if state == "HI" and city_part.lower() in _HAWAIIAN_ISLANDS:
-            return f"{_HAWAIIAN_ISLANDS[city_part.lower()]}, HI, US"
+        if state == "HI":
+            town = _HAWAIIAN_ISLANDS.get(city_part.lower())
+            if town:
+                return f"{town}, HI, US"
         return f"{city_part}, {state}, US"
     return city
 
+# Resolved API key; only a found key is cached, so a lookup made before the
+# app config is available is retried on the next call.
+_api_key: str | None = None
+
 def _get_api_key() -> str | None:
+    global _api_key
+    if _api_key:
+        return _api_key
     key = os.getenv("OPENWEATHER_API_KEY")
     if not key and has_app_context():
         key = current_app.config.get("OPENWEATHER_API_KEY")
-    return key or None
+    _api_key = key or None
+    return _api_key
+
+# OpenWeather condition groups are id // 100 (2xx thunderstorm ... 7xx atmosphere);
+# "" marks groups with no icon of their own (they fall back to the description).
+_EMOJI_BY_GROUP = ("", "", "⛈️", "🌦️", "", "🌧️", "❄️", "🌫️")
+_EMOJI_CLEAR_CLOUDS = {800: "☀️", 801: "⛅", 802: "⛅", 803: "☁️", 804: "☁️"}
 
 def _emoji_for(weather_id: int, main: str, descr: str) -> str:
-    if 200 <= weather_id < 300: return "⛈️"
-    if 300 <= weather_id < 400: return "🌦️"
-    if 500 <= weather_id < 600: return "🌧️"
-    if 600 <= weather_id < 700: return "❄️"
-    if 700 <= weather_id < 800: return "🌫️"
-    if weather_id == 800: return "☀️"
-    if 801 <= weather_id <= 804: return "⛅" if weather_id in (801, 802) else "☁️"
+    emoji = _EMOJI_CLEAR_CLOUDS.get(weather_id)
+    if emoji: return emoji
+    if 0 <= weather_id < 800:
+        emoji = _EMOJI_BY_GROUP[int(weather_id // 100)]
+        if emoji: return emoji
     d = (descr or "").lower()
     if "rain" in d: return "🌧️"
     if "snow" in d: return "❄️"
@@ -211,15 +383,14 @@ def get_weather_for_city(city: str | None) -> Optional[Dict]:
         return None
 
     base_url = "https://api.openweathermap.org/data/2.5/weather"
-    session = requests.Session()
 
     def _call_q(q: str) -> requests.Response:
-        return session.get(base_url, params={"q": q, "appid": key, "units": "metric"}, timeout=6)
+        return _rate_limited_get(base_url, params={"q": q, "appid": key, "units": "metric"}, timeout=6)
     def _call_zip(zip5: str) -> requests.Response:
-        return session.get(base_url, params={"zip": f"{zip5},US", "appid": key, "units": "metric"}, timeout=6)
+        return _rate_limited_get(base_url, params={"zip": f"{zip5},US", "appid": key, "units": "metric"}, timeout=6)
 
     try:
-        mzip = _US_ZIP.match(city)
+        mzip = _US_ZIP.fullmatch(city.strip())
         if mzip:
             r = _call_zip(mzip.group(1))
             if r.status_code == 404:
@@ -233,7 +404,7 @@ def get_weather_for_city(city: str | None) -> Optional[Dict]:
                 r = _call_q(city)
             r.raise_for_status()
 
-        data = r.json()
+        data = _json_loads(r.content)
         temp_c = data.get("main", {}).get("temp")
         wind_mps = data.get("wind", {}).get("speed")
         wid = (data.get("weather") or [{}])[0].get("id", 800)
@@ -258,27 +429,112 @@ def get_weather_for_city(city: str | None) -> Optional[Dict]:
     except Exception:
         return None
 
+# On-disk cache for _coords_for, shared by all worker processes and kept
+# across restarts. Only the place (lat/lon/name) is stored: coordinates don't
+# change, so a day-long TTL is safe, while the UTC offset does (DST) and is
+# taken from each live forecast response instead.
+_COORD_DB_TTL = 24 * 60 * 60
+_coord_db_path: str | None | bool = None  # False once unavailable
+# One connection per thread; sqlite does its own locking across threads and
+# processes, so lookups and writes never queue on an in-process lock.
+_coord_db_local = threading.local()
+
+
+def _coord_db_conn() -> Optional[sqlite3.Connection]:
+    """
+    Open this thread's connection to the coords cache database on first use.
+
+    Uses WEATHER_COORD_CACHE_PATH if set, otherwise coord_cache.sqlite in the
+    Flask instance folder. Returns None if neither is available or the file
+    can't be opened; the disk cache is an optimization only.
+    """
+    global _coord_db_path
+    conn = getattr(_coord_db_local, "conn", None)
+    if conn is not None or _coord_db_path is False:
+        return conn
+    path = _coord_db_path or os.getenv("WEATHER_COORD_CACHE_PATH")
+    if not path and has_app_context():
+        path = os.path.join(current_app.instance_path, "coord_cache.sqlite")
+    if not path:
+        return None
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn = sqlite3.connect(path, timeout=2)
+        conn.execute("PRAGMA journal_mode=WAL")  # readers don't wait on a writer
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS coords ("
+            "city TEXT PRIMARY KEY, lat REAL, lon REAL, name TEXT, ts INTEGER)"
+        )
+        conn.commit()
+    except Exception:
+        _coord_db_path = False
+        return None
+    _coord_db_path = path
+    _coord_db_local.conn = conn
+    return conn
+
+
+def _load_coords(city: str):
+    """Return (lat, lon, name) from the disk cache if fresh, else None."""
+    conn = _coord_db_conn()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute(
+            "SELECT lat, lon, name FROM coords WHERE city = ? AND ts > ?",
+            (city, int(time.time()) - _COORD_DB_TTL),
+        ).fetchone()
+    except Exception:
+        return None
+    return tuple(row) if row else None
+
+
+def _store_coords(city: str, coords: tuple) -> None:
+    """Write a successful coords lookup to the disk cache (best-effort)."""
+    conn = _coord_db_conn()
+    if conn is None:
+        return
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO coords (city, lat, lon, name, ts) VALUES (?, ?, ?, ?, ?)",
+            (city, *coords, int(time.time())),
+        )
+        conn.commit()
+    except Exception:
+        pass
+
+
 @ttl_cache()  # Cache coords lookups
 def _coords_for(city: str, key: str):
-    """Auto-doc: see function name for purpose."""
+    """
+    Look up (lat, lon, name) for a city or US ZIP.
+
+    Checks the on-disk coords cache before calling OpenWeather and saves
+    successful lookups to it.
+    """
+    cached = _load_coords(city)
+    if cached:
+        return cached
+
     base = "https://api.openweathermap.org/data/2.5/weather"
-    session = requests.Session()
     params = {"appid": key, "units": "metric"}
-    mzip = _US_ZIP.match(city)
+    mzip = _US_ZIP.fullmatch(city.strip())
     if mzip:
         params["zip"] = f"{mzip.group(1)},US"
     else:
         params["q"] = _normalize_city_query(city)
     try:
-        r = session.get(base, params=params, timeout=6)
+        r = _rate_limited_get(base, params=params, timeout=6)
         if r.status_code == 404 and not mzip:
-            r = session.get(base, params={"q": city, "appid": key, "units": "metric"}, timeout=6)
+            r = _rate_limited_get(base, params={"q": city, "appid": key, "units": "metric"}, timeout=6)
         r.raise_for_status()
-        data = r.json()
+        data = _json_loads(r.content)
         coord = data.get("coord") or {}
-        tz = data.get("timezone", 0)
         name = data.get("name", city)
-        return coord.get("lat"), coord.get("lon"), tz, name
+        coords = (coord.get("lat"), coord.get("lon"), name)
+        if coords[0] is not None and coords[1] is not None:
+            _store_coords(city, coords)
+        return coords
     except Exception:
         return None
 
@@ -303,12 +559,50 @@ def get_city_latitude(city: str | None) -> Optional[float]:
     if not coords:
         return None
 
-    lat, _, _, _ = coords
+    lat, _, _ = coords
     return lat
 
 
+def _parse_forecast_item(it: Dict) -> tuple:
+    """
+    Pull the fields the forecast views use out of one 3-hourly entry.
+
+    Returns:
+        (dt, temp_c, humidity, wind_mps, weather_id, weather_main,
+         description, precip_mm)
+    """
+    main = it.get("main") or {}
+    weather = (it.get("weather") or ({},))[0]
+    return (
+        it["dt"],
+        main.get("temp"),
+        main.get("humidity"),
+        (it.get("wind") or {}).get("speed"),
+        weather.get("id", 800),
+        weather.get("main", ""),
+        weather.get("description", ""),
+        # 3-hour rain + snow totals
+        (it.get("rain") or {}).get("3h", 0) + (it.get("snow") or {}).get("3h", 0),
+    )
+
+
 @ttl_cache()
-def get_forecast_for_city(city: str | None) -> Optional[List[Dict]]:
+def _raw_forecast(city: str | None) -> Optional[Dict]:
+    """
+    Fetch the 3-hourly forecast for a city once, for every forecast view.
+
+    get_forecast_for_city, get_hourly_for_city, get_precipitation_forecast_24h
+    and get_temperature_extremes_forecast are projections of this payload, so
+    together they cost one forecast request per city per TTL window.
+
+    Each entry is parsed once here (see _parse_forecast_item) rather than
+    by every view.
+
+    Returns:
+        {"items": list of parsed entries, "tz_offset": seconds from UTC
+         (current, from the forecast response), "coords": _coords_for
+         result}, or None on failure
+    """
     if not city:
         return None
     key = _get_api_key()
@@ -318,43 +612,67 @@ def get_forecast_for_city(city: str | None) -> Optional[List[Dict]]:
     coords = _coords_for(city, key)
     if not coords:
         return None
-    lat, lon, tz_offset, _ = coords
+    lat, lon, _ = coords
 
     url = "https://api.openweathermap.org/data/2.5/forecast"
     try:
-        r = requests.get(url, params={"lat": lat, "lon": lon, "appid": key, "units": "metric"}, timeout=8)
+        r = _rate_limited_get(url, params={"lat": lat, "lon": lon, "appid": key, "units": "metric"}, timeout=8)
         r.raise_for_status()
-        data = r.json()
-        items = data.get("list") or []
-        now_utc = datetime.now(tz=timezone.utc)
-        today_local = (now_utc + timedelta(seconds=tz_offset)).strftime("%Y-%m-%d")
-
-        by_date: dict[str, list[dict]] = defaultdict(list)
-        for it in items:
-            dt_utc = datetime.fromtimestamp(it["dt"], tz=timezone.utc)
-            local_dt = dt_utc + timedelta(seconds=tz_offset)
-            local_date = local_dt.strftime("%Y-%m-%d")
-            by_date[local_date].append(it)
+        data = _json_loads(r.content)
+        items = [_parse_forecast_item(it) for it in data.get("list") or []]
+        tz_offset = (data.get("city") or {}).get("timezone", 0)
+        return {"items": items, "tz_offset": tz_offset, "coords": coords}
+    except Exception:
+        return None
+
+
+@ttl_cache()
+def get_forecast_for_city(city: str | None) -> Optional[List[Dict]]:
+    raw = _raw_forecast(city)
+    if not raw:
+        return None
+    items = raw["items"]
+    tz_offset = raw["tz_offset"]
+
+    try:
+        today_local = time.strftime("%Y-%m-%d", time.gmtime(time.time() + tz_offset))
+
+        # Single pass over the 3-hourly items: fold each one straight into its
+        # local day's running stats instead of bucketing and re-scanning.
+        # acc = [tmin, tmax, hum_sum, hum_n, wind_sum, wind_n, desc_counts,
+        #        first_cond, first_local_tm]
+        # Local dates come straight from epoch + offset via gmtime, no datetimes.
+        by_date: dict[str, list] = {}
+        for dt, temp, hum, wind, wid, wmain, wdesc, _ in items:
+            local_tm = time.gmtime(dt + tz_offset)
+            local_date = time.strftime("%Y-%m-%d", local_tm)
+
+            acc = by_date.get(local_date)
+            if acc is None:
+                acc = by_date[local_date] = [None, None, 0, 0, 0, 0, Counter(), (wid, wmain, wdesc), local_tm]
+            if isinstance(temp, (int, float)):
+                if acc[0] is None or temp < acc[0]:
+                    acc[0] = temp
+                if acc[1] is None or temp > acc[1]:
+                    acc[1] = temp
+            if isinstance(hum, (int, float)):
+                acc[2] += hum
+                acc[3] += 1
+            if isinstance(wind, (int, float)):
+                acc[4] += wind
+                acc[5] += 1
+            if wdesc:
+                acc[6][wdesc] += 1
 
         daily = []
-        for date_str, bucket in sorted(by_date.items()):
-            temps = [x.get("main", {}).get("temp") for x in bucket if isinstance(x.get("main", {}).get("temp"), (int,float))]
-            hums = [x.get("main", {}).get("humidity") for x in bucket if isinstance(x.get("main", {}).get("humidity"), (int,float))]
-            winds = [x.get("wind", {}).get("speed") for x in bucket if isinstance(x.get("wind", {}).get("speed"), (int,float))]
-            conds = [((x.get("weather") or [{}])[0].get("id", 800),
-                      (x.get("weather") or [{}])[0].get("main", ""),
-                      (x.get("weather") or [{}])[0].get("description","")) for x in bucket]
-            if not temps:
+        for date_str, (tmin_c, tmax_c, hum_sum, hum_n, wind_sum, wind_n, desc_counts, first_cond, local_tm) in sorted(by_date.items()):
+            if tmin_c is None:
                 continue
-            tmin_c = min(temps)
-            tmax_c = max(temps)
-            desc_counts = Counter([c[2] for c in conds if c[2]])
             top_desc = (desc_counts.most_common(1)[0][0]) if desc_counts else "clear sky"
-            wid, wmain, wdesc = conds[0] if conds else (800, "Clear", top_desc)
+            wid, wmain, wdesc = first_cond
             emoji = _emoji_for(wid, wmain, top_desc)
 
-            dt_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            day = dt_obj.strftime("%a")
+            day = time.strftime("%a", local_tm)
 
             daily.append({
                 "date": date_str,
@@ -364,9 +682,9 @@ def get_forecast_for_city(city: str | None) -> Optional[List[Dict]]:
                 "temp_max_c": round(tmax_c, 1),
                 "temp_min_f": round((tmin_c * 9/5) + 32, 1),
                 "temp_max_f": round((tmax_c * 9/5) + 32, 1),
-                "humidity": round(sum(hums)/len(hums)) if hums else None,
-                "wind_mps": round(sum(winds)/len(winds), 1) if winds else None,
-                "wind_mph": round((sum(winds)/len(winds)) * 2.23694, 1) if winds else None,
+                "humidity": round(hum_sum/hum_n) if hum_n else None,
+                "wind_mps": round(wind_sum/wind_n, 1) if wind_n else None,
+                "wind_mph": round((wind_sum/wind_n) * 2.23694, 1) if wind_n else None,
                 "conditions": top_desc,
                 "emoji": emoji,
             })
@@ -375,9 +693,9 @@ def get_forecast_for_city(city: str | None) -> Optional[List[Dict]]:
     except Exception:
         return None
 
-def _fmt_hour_label(dt_local: datetime) -> str:
+def _fmt_hour_label(local_tm: time.struct_time) -> str:
     # Cross-platform 12h format without leading zero
-    label = dt_local.strftime("%I%p")  # e.g., "01PM"
+    label = time.strftime("%I%p", local_tm)  # e.g., "01PM"
     return label.lstrip("0") if label[0] == "0" else label
 
 @ttl_cache()
@@ -387,54 +705,38 @@ def get_hourly_for_city(city: str | None) -> Optional[List[Dict]]:
     Each entry includes a ``date_label`` (e.g. "Mon") so the UI can show
     date-change dividers in the scrollable row.
     """
-    if not city:
-        return None
-    key = _get_api_key()
-    if not key:
+    raw = _raw_forecast(city)
+    if not raw:
         return None
+    items = raw["items"]
+    tz_offset = raw["tz_offset"]
 
-    coords = _coords_for(city, key)
-    if not coords:
-        return None
-    lat, lon, tz_offset, _ = coords
-
-    url = "https://api.openweathermap.org/data/2.5/forecast"
     try:
-        r = requests.get(url, params={"lat": lat, "lon": lon, "appid": key, "units": "metric"}, timeout=8)
-        r.raise_for_status()
-        data = r.json()
-        items = data.get("list") or []
 
-        now_local = datetime.now(timezone.utc) + timedelta(seconds=tz_offset)
-        today_str = now_local.strftime("%Y-%m-%d")
-        tomorrow_str = (now_local + timedelta(days=1)).strftime("%Y-%m-%d")
+        now_ts = time.time()
+        tomorrow_str = time.strftime("%Y-%m-%d", time.gmtime(now_ts + tz_offset + 86400))
 
         upcoming = []
 
-        for it in items:
-            dt_local = datetime.fromtimestamp(it["dt"], tz=timezone.utc) + timedelta(seconds=tz_offset)
-            if dt_local <= now_local:
+        for dt, temp_c, _, _, wid, wmain, wdesc, _ in items:
+            if dt <= now_ts:
                 continue
 
-            date_str = dt_local.strftime("%Y-%m-%d")
+            local_tm = time.gmtime(dt + tz_offset)
+            date_str = time.strftime("%Y-%m-%d", local_tm)
             if date_str > tomorrow_str:
                 break
 
-            temp_c = it.get("main", {}).get("temp")
             if not isinstance(temp_c, (int, float)):
                 continue
 
-            wid = (it.get("weather") or [{}])[0].get("id", 800)
-            wmain = (it.get("weather") or [{}])[0].get("main", "")
-            wdesc = (it.get("weather") or [{}])[0].get("description", "")
-
             upcoming.append({
-                "time": _fmt_hour_label(dt_local),
+                "time": _fmt_hour_label(local_tm),
                 "temp_c": temp_c,
                 "temp_f": round((temp_c * 9/5) + 32, 1),
                 "emoji": _emoji_for(wid, wmain, wdesc),
                 "is_tomorrow": date_str == tomorrow_str,
-                "date_label": dt_local.strftime("%a"),
+                "date_label": time.strftime("%a", local_tm),
             })
 
         return upcoming
@@ -444,21 +746,27 @@ def get_hourly_for_city(city: str | None) -> Optional[List[Dict]]:
 def get_weather_alerts_for_city(current: Optional[Dict], forecast: Optional[List[Dict]]) -> List[Dict]:
     alerts: List[Dict] = []
     try:
-        if current and isinstance(current.get("temp_f"), (int, float)):
-            if current["temp_f"] >= 95:
-                alerts.append({"title": "Heat Advisory", "desc": "High temperatures. Water may evaporate quickly."})
-            if current["temp_f"] <= 35:
-                alerts.append({"title": "Freeze Risk", "desc": "Protect sensitive plants from cold exposure."})
-        if current and isinstance(current.get("wind_mph"), (int, float)) and current["wind_mph"] >= 20:
-            alerts.append({"title": "Windy Conditions", "desc": "Strong winds can increase transpiration and stress."})
+        if current:
+            temp_f = current.get("temp_f")
+            if isinstance(temp_f, (int, float)):
+                if temp_f >= 95:
+                    alerts.append({"title": "Heat Advisory", "desc": "High temperatures. Water may evaporate quickly."})
+                elif temp_f <= 35:
+                    alerts.append({"title": "Freeze Risk", "desc": "Protect sensitive plants from cold exposure."})
+            wind_mph = current.get("wind_mph")
+            if isinstance(wind_mph, (int, float)) and wind_mph >= 20:
+                alerts.append({"title": "Windy Conditions", "desc": "Strong winds can increase transpiration and stress."})
 
         if forecast:
             for d in forecast[:2]:
-                if isinstance(d.get("temp_max_f"), (int,float)) and d["temp_max_f"] >= 95:
-                    alerts.append({"title": "Upcoming Heat", "desc": f"Highs near {round(d['temp_max_f'])}°F expected."})
-                if isinstance(d.get("temp_min_f"), (int,float)) and d["temp_min_f"] <= 35:
-                    alerts.append({"title": "Cold Overnight", "desc": f"Lows near {round(d['temp_min_f'])}°F expected."})
-                if isinstance(d.get("wind_mph"), (int,float)) and d["wind_mph"] >= 20:
+                max_f = d.get("temp_max_f")
+                min_f = d.get("temp_min_f")
+                wind_mph = d.get("wind_mph")
+                if isinstance(max_f, (int, float)) and max_f >= 95:
+                    alerts.append({"title": "Upcoming Heat", "desc": f"Highs near {round(max_f)}°F expected."})
+                if isinstance(min_f, (int, float)) and min_f <= 35:
+                    alerts.append({"title": "Cold Overnight", "desc": f"Lows near {round(min_f)}°F expected."})
+                if isinstance(wind_mph, (int, float)) and wind_mph >= 20:
                     alerts.append({"title": "Windy Forecast", "desc": "Elevated winds expected. Consider wind protection."})
     except Exception:
         return []
@@ -511,35 +819,20 @@ def get_precipitation_forecast_24h(city: str | None) -> Optional[float]:
     Note: Uses 3-hourly forecast data. Precipitation is estimated
     from weather conditions (rain/snow).
     """
-    if not city:
-        return None
-    key = _get_api_key()
-    if not key:
-        return None
-
-    coords = _coords_for(city, key)
-    if not coords:
+    raw = _raw_forecast(city)
+    if not raw:
         return None
-    lat, lon, tz_offset, _ = coords
+    items = raw["items"]
 
-    url = "https://api.openweathermap.org/data/2.5/forecast"
     try:
-        r = requests.get(url, params={"lat": lat, "lon": lon, "appid": key, "units": "metric"}, timeout=8)
-        r.raise_for_status()
-        data = r.json()
-        items = data.get("list") or []
 
-        now_utc = datetime.now(timezone.utc)
-        cutoff = now_utc + timedelta(hours=24)
+        now_ts = time.time()
+        cutoff = now_ts + 24 * 3600
 
         total_precip_mm = 0.0
-        for it in items:
-            dt_utc = datetime.fromtimestamp(it["dt"], tz=timezone.utc)
-            if now_utc <= dt_utc <= cutoff:
-                # Extract precipitation from rain and snow fields
-                rain_mm = it.get("rain", {}).get("3h", 0)  # 3-hour rainfall
-                snow_mm = it.get("snow", {}).get("3h", 0)  # 3-hour snowfall
-                total_precip_mm += rain_mm + snow_mm
+        for dt, *_, precip_mm in items:
+            if now_ts <= dt <= cutoff:
+                total_precip_mm += precip_mm
 
         # Convert mm to inches (1 inch = 25.4 mm)
         total_precip_inches = total_precip_mm / 25.4
@@ -568,32 +861,19 @@ def get_temperature_extremes_forecast(city: str | None, hours: int = 48) -> Opti
         }
         or None on error
     """
-    if not city:
-        return None
-    key = _get_api_key()
-    if not key:
-        return None
-
-    coords = _coords_for(city, key)
-    if not coords:
+    raw = _raw_forecast(city)
+    if not raw:
         return None
-    lat, lon, tz_offset, _ = coords
+    items = raw["items"]
 
-    url = "https://api.openweathermap.org/data/2.5/forecast"
     try:
-        r = requests.get(url, params={"lat": lat, "lon": lon, "appid": key, "units": "metric"}, timeout=8)
-        r.raise_for_status()
-        data = r.json()
-        items = data.get("list") or []
 
-        now_utc = datetime.now(timezone.utc)
-        cutoff = now_utc + timedelta(hours=hours)
+        now_ts = time.time()
+        cutoff = now_ts + hours * 3600
 
         temps_c = []
-        for it in items:
-            dt_utc = datetime.fromtimestamp(it["dt"], tz=timezone.utc)
-            if now_utc <= dt_utc <= cutoff:
-                temp = it.get("main", {}).get("temp")
+        for dt, temp, *_ in items:
+            if now_ts <= dt <= cutoff:
                 if isinstance(temp, (int, float)):
                     temps_c.append(temp)
 
@@ -651,9 +931,12 @@ def get_seasonal_pattern(
     current = get_weather_for_city(city)
     extremes = get_temperature_extremes_forecast(city, hours=48)
 
-    # Auto-detect latitude if not provided (for hemisphere detection)
+    # Auto-detect latitude if not provided (for hemisphere detection). The
+    # extremes call above already geocoded the city for its forecast fetch,
+    # so reuse those coordinates rather than looking them up again.
     if latitude is None:
-        latitude = get_city_latitude(city)
+        raw = _raw_forecast(city)
+        latitude = raw["coords"][0] if raw else get_city_latitude(city)
 
     # Detect hemisphere (negative latitude = Southern Hemisphere)
     is_southern = latitude is not None and latitude < 0
@@ -724,6 +1007,13 @@ def get_seasonal_pattern(
     }
 
 
+# Latitude band lower bounds (rough estimates for the U.S.) and the zone for
+# each band: _ZONE_NAMES[i] covers _ZONE_LATS[i-1] <= lat < _ZONE_LATS[i].
+# Below 24° is Southern Florida/Hawaii; 49° and up is the northern border.
+_ZONE_LATS = (24, 27, 30, 31.5, 33, 36, 37.5, 39, 42, 45, 48, 49)
+_ZONE_NAMES = ("11a", "10b", "10a", "9b", "9a", "8b", "8a", "7b", "7a", "6a", "5a", "4a", "3b")
+
+
 def infer_hardiness_zone(city: str | None, state: str | None = None) -> Optional[str]:
     """
     Infer USDA hardiness zone from city coordinates.
@@ -752,32 +1042,10 @@ def infer_hardiness_zone(city: str | None, state: str | None = None) -> Optional
     if not coords:
         return None
 
-    lat, lon, _, _ = coords
+    lat, _, _ = coords
 
     # Simplified hardiness zone lookup based on latitude (U.S. focused)
     # Source: USDA Plant Hardiness Zone Map (simplified approximation)
-    # Zones range from 1 (coldest) to 13 (warmest)
-
-    # Latitude-based approximation (rough estimates for U.S.)
-    if lat >= 48:  # Northern border
-        return "3b" if lat >= 49 else "4a"
-    elif lat >= 45:
-        return "5a"
-    elif lat >= 42:
-        return "6a"
-    elif lat >= 39:
-        return "7a"
-    elif lat >= 36:
-        return "7b" if lat >= 37.5 else "8a"
-    elif lat >= 33:
-        return "8b"
-    elif lat >= 30:
-        return "9a" if lat >= 31.5 else "9b"
-    elif lat >= 27:
-        return "10a"
-    elif lat >= 24:
-        return "10b"
-    else:  # Southern Florida, Hawaii
-        return "11a"
+    return _ZONE_NAMES[bisect_right(_ZONE_LATS, lat)]
 
     # Future enhancement: Use actual USDA zone data with more precise lookup
\ No newline at end of file
@@ -8,10 +8,9 @@ Provides:
 """
 
 from __future__ import annotations
-from datetime import datetime
 from functools import wraps
 from typing import Optional, Dict, Any
-from flask import session, redirect, url_for, request, flash, g
+from flask import session, redirect, url_for, request, flash, g, has_request_context, current_app
 from app.services import supabase_client
 
 
@@ -67,6 +66,73 @@ def get_current_user_id() -> Optional[str]:
     return user.get("id") if user else None
 
 
+def _request_profile(user_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch a user's profile at most once per request (memoized on g)."""
+    profiles = g.setdefault("profiles", {})
+    if user_id not in profiles:
+        profiles[user_id] = supabase_client.get_user_profile(user_id)
+    return profiles[user_id]
+
+
+def get_current_profile() -> Optional[Dict[str, Any]]:
+    """
+    Get the current user's profile, cached for the rest of the request.
+
+    Shared by the auth decorators and the template context processor so a
+    page render costs one Supabase profile query. Code that has just
+    written to the profile should call supabase_client.get_user_profile()
+    directly to see the update.
+
+    Returns:
+        Profile dict or None if not logged in / not found
+    """
+    user_id = get_current_user_id()
+    return _request_profile(user_id) if user_id else None
+
+
+def _request_auth_bundle(user_id: str) -> Dict[str, Any]:
+    """Profile plus plan/trial flags for a user, computed once per request."""
+    bundles = g.setdefault("auth_bundles", {})
+    bundle = bundles.get(user_id)
+    if bundle is not None:
+        return bundle
+
+    # Fetch profile once per request (shared with the auth decorators)
+    profile = _request_profile(user_id)
+
+    # Plan and trial status, using the same checks as has_premium_access()
+    is_premium = supabase_client._profile_is_premium(profile)
+    trial_remaining = supabase_client._profile_trial_remaining(profile)
+    is_in_trial = trial_remaining is not None
+    trial_days_remaining = trial_remaining.days if is_in_trial else 0
+
+    bundle = bundles[user_id] = {
+        "profile": profile,
+        "is_premium": is_premium,
+        "is_in_trial": is_in_trial,
+        "trial_days_remaining": trial_days_remaining,
+        "has_premium_access": is_premium or is_in_trial,
+    }
+    return bundle
+
+
+def get_current_auth_bundle() -> Optional[Dict[str, Any]]:
+    """
+    Get the current user's profile and plan status from one profile query.
+
+    Returns the same values the template context exposes, cached for the
+    rest of the request, so views don't need separate is_premium /
+    is_in_trial / trial_days_remaining / has_premium_access calls (each of
+    which fetches the profile again).
+
+    Returns:
+        Dict with profile, is_premium, is_in_trial, trial_days_remaining and
+        has_premium_access, or None if not logged in
+    """
+    user_id = get_current_user_id()
+    return _request_auth_bundle(user_id) if user_id else None
+
+
 def set_session(user: Dict[str, Any], access_token: str, refresh_token: Optional[str] = None) -> None:
     """
     Store user session data.
@@ -117,7 +183,7 @@ def is_admin(user_id: Optional[str]) -> bool:
     if not user_id:
         return False
 
-    profile = supabase_client.get_user_profile(user_id)
+    profile = _request_profile(user_id)
     return bool(profile and profile.get("is_admin", False))
 
 
@@ -151,6 +217,56 @@ def require_auth(f):
     return decorated_function
 
 
+def _require(check, fail_message: str, fail_category: str, fail_endpoint: str):
+    """
+    Build a route decorator that requires sign-in plus an extra check.
+
+    Args:
+        check: Callable taking the signed-in user's ID, returning True to allow
+        fail_message: Flash message shown when the check fails
+        fail_category: Flash category for fail_message
+        fail_endpoint: Endpoint to redirect to when the check fails
+
+    Returns:
+        Decorator for view functions
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            # First check authentication (one session lookup for both steps)
+            user_id = get_current_user_id()
+            if not user_id:
+                flash("Please sign in to access this page.", "info")
+                return redirect(url_for("auth.signup", next=request.url))
+
+            if not check(user_id):
+                flash(fail_message, fail_category)
+                return redirect(url_for(fail_endpoint))
+
+            return f(*args, **kwargs)
+
+        return decorated_function
+
+    return decorator
+
+
+# Check premium access
+_require_premium = _require(
+    lambda user_id: supabase_client.has_premium_access(user_id),
+    "This feature requires a Premium plan. Upgrade to get unlimited access!",
+    "warning",
+    "pricing.index",
+)
+
+# Check admin privileges (request-scoped profile shared with templates)
+_require_admin = _require(
+    is_admin,
+    "Access denied. Admin privileges required.",
+    "error",
+    "dashboard.index",
+)
+
+
 def require_premium(f):
     """
     Decorator to require premium plan for a route.
@@ -165,22 +281,7 @@ def require_premium(f):
             # Only premium users can access this
             return generate_pdf()
     """
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        # First check authentication
-        if not is_authenticated():
-            flash("Please sign in to access this page.", "info")
-            return redirect(url_for("auth.signup", next=request.url))
-
-        # Check premium access
-        user_id = get_current_user_id()
-        if not supabase_client.has_premium_access(user_id):
-            flash("This feature requires a Premium plan. Upgrade to get unlimited access!", "warning")
-            return redirect(url_for("pricing.index"))
-
-        return f(*args, **kwargs)
-
-    return decorated_function
+    return _require_premium(f)
 
 
 def require_admin(f):
@@ -198,24 +299,7 @@ def require_admin(f):
             # Only admin users can access this
             return render_template('admin/metrics.html')
     """
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        # First check authentication
-        if not is_authenticated():
-            flash("Please sign in to access this page.", "info")
-            return redirect(url_for("auth.signup", next=request.url))
-
-        # Check admin privileges
-        user_id = get_current_user_id()
-        profile = supabase_client.get_user_profile(user_id)
-
-        if not profile or not profile.get("is_admin", False):
-            flash("Access denied. Admin privileges required.", "error")
-            return redirect(url_for("dashboard.index"))
-
-        return f(*args, **kwargs)
-
-    return decorated_function
+    return _require_admin(f)
 
 
 def optional_auth(f):
@@ -249,6 +333,19 @@ def optional_auth(f):
 # Helper Functions for Templates
 # ============================================================================
 
+# Template context for visitors who aren't signed in
+_ANONYMOUS_AUTH_CONTEXT = {
+    "current_user": None,
+    "is_authenticated": False,
+    "is_premium": False,
+    "is_in_trial": False,
+    "trial_days_remaining": 0,
+    "has_premium_access": False,
+    "profile": None,
+    "show_legal_banner": False,
+}
+
+
 def inject_auth_context():
     """
     Context processor to inject auth data into all templates.
@@ -266,43 +363,27 @@ def inject_auth_context():
         - profile: User profile dict or None (includes theme_preference)
         - show_legal_banner: Boolean (True when user hasn't acknowledged latest legal update)
     """
+    # Renders outside a request have no session, so skip the session check
+    # and profile fetch
+    if not has_request_context():
+        return dict(_ANONYMOUS_AUTH_CONTEXT)
+
     user = get_current_user()
     user_id = user.get("id") if user else None
 
     # Default values for unauthenticated users
     if not user_id:
-        return {
-            "current_user": None,
-            "is_authenticated": False,
-            "is_premium": False,
-            "is_in_trial": False,
-            "trial_days_remaining": 0,
-            "has_premium_access": False,
-            "profile": None,
-            "show_legal_banner": False,
-        }
-
-    # Fetch profile once (avoids N+1 queries)
-    profile = supabase_client.get_user_profile(user_id)
-
-    # Compute premium status from profile
-    is_premium = profile.get("plan") == "premium" if profile else False
-
-    # Compute trial status from profile
-    is_in_trial = False
-    trial_days_remaining = 0
-    if profile:
-        trial_ends_at = profile.get("trial_ends_at")
-        if trial_ends_at:
-            try:
-                trial_end = datetime.fromisoformat(trial_ends_at.replace("Z", "+00:00"))
-                now = datetime.utcnow()
-                is_in_trial = now < trial_end.replace(tzinfo=None)
-                if is_in_trial:
-                    delta = trial_end.replace(tzinfo=None) - now
-                    trial_days_remaining = max(0, delta.days)
-            except Exception:
-                pass
+        return dict(_ANONYMOUS_AUTH_CONTEXT)
+
+    # Already computed for this user earlier in the request (e.g. a view that
+    # renders more than one template): skip re-parsing the profile dates
+    cached = g.get("auth_context")
+    if cached is not None and cached[0] == user_id:
+        return cached[1]
+
+    # Profile and plan status, shared with views and the auth decorators
+    bundle = _request_auth_bundle(user_id)
+    profile = bundle["profile"]
 
     # Check if user needs to acknowledge latest legal update
     show_legal_banner = False
@@ -314,19 +395,20 @@ def inject_auth_context():
             show_legal_banner = True
         else:
             try:
-                from flask import current_app
                 legal_date = current_app.config.get("LEGAL_LAST_UPDATED", "")
                 show_legal_banner = ack[:10] < legal_date
             except (TypeError, ValueError):
                 show_legal_banner = True
 
-    return {
+    context = {
         "current_user": user,
         "is_authenticated": True,
-        "is_premium": is_premium,
-        "is_in_trial": is_in_trial,
-        "trial_days_remaining": trial_days_remaining,
-        "has_premium_access": is_premium or is_in_trial,
+        "is_premium": bundle["is_premium"],
+        "is_in_trial": bundle["is_in_trial"],
+        "trial_days_remaining": bundle["trial_days_remaining"],
+        "has_premium_access": bundle["has_premium_access"],
         "profile": profile,
         "show_legal_banner": show_legal_banner,
     }
+    g.auth_context = (user_id, context)
+    return context
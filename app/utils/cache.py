@@ -5,19 +5,103 @@ Provides time-based caching for expensive operations like database queries.
 """
 
 from __future__ import annotations
-from cachetools import TTLCache
 from typing import Callable, Any, Hashable
+from concurrent.futures import Future
 from functools import wraps
 import threading
+import time
 
 # Cache configuration constants
 CALENDAR_CACHE_TTL_SECONDS = 300  # 5 minutes
 CALENDAR_CACHE_MAX_ENTRIES = 1000
 
-# Thread-safe calendar cache (5-minute TTL, max 1000 entries)
+
+class _CalendarShard:
+    """
+    Minimal TTL cache that also indexes its keys by user.
+
+    Entries are stored as {key: (expires_at, value)} in a plain dict, so a
+    hit is one dict lookup plus a monotonic clock comparison. Expired
+    entries are dropped when they are read, or swept when the shard is
+    full; after that the oldest entry is evicted. Not thread-safe on its
+    own - callers hold the shard lock.
+
+    The user index lets invalidate_user_calendar_cache drop one user's
+    months directly instead of scanning every key.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[str, tuple[float, Any]] = {}
+        self.user_keys: dict[str, set[str]] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            self.pop(key)
+            return default
+        return entry[1]
+
+    def add(self, user_id: str, key: str, value: Any) -> None:
+        data = self._data
+        if key not in data and len(data) >= self.maxsize:
+            self.expire()
+            while len(data) >= self.maxsize:
+                self.pop(next(iter(data)))
+        data[key] = (time.monotonic() + self.ttl, value)
+        self.user_keys.setdefault(user_id, set()).add(key)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        self._unindex(key)
+        return entry[1]
+
+    def expire(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+            self.pop(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.user_keys.clear()
+
+    def _unindex(self, key: str) -> None:
+        # "calendar:{user_id}:{year}:{month}" -> user_id
+        user_id = key[len("calendar:"):].rsplit(":", 2)[0]
+        keys = self.user_keys.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.user_keys[user_id]
+
+
+# Thread-safe calendar cache (5-minute TTL, max 1000 entries), striped into
+# shards by user so concurrent requests for different users don't contend on
+# one lock. All of a user's entries live in the same shard.
 # Key format: "calendar:{user_id}:{year}:{month}"
-_calendar_cache = TTLCache(maxsize=CALENDAR_CACHE_MAX_ENTRIES, ttl=CALENDAR_CACHE_TTL_SECONDS)
-_cache_lock = threading.Lock()
+_CACHE_SHARDS = 16  # power of two: shard index is a bit mask of the hash
+_calendar_shards = [
+    _CalendarShard(maxsize=-(-CALENDAR_CACHE_MAX_ENTRIES // _CACHE_SHARDS), ttl=CALENDAR_CACHE_TTL_SECONDS)
+    for _ in range(_CACHE_SHARDS)
+]
+_shard_locks = [threading.Lock() for _ in range(_CACHE_SHARDS)]
+# Misses currently being computed, per shard: {cache_key: Future}. Guarded by
+# the shard lock; concurrent misses on one key share a single query.
+_inflight_shards: list[dict[str, Future]] = [{} for _ in range(_CACHE_SHARDS)]
+
+
+# Sentinel for cache misses (a cached result may legitimately be None)
+_MISS = object()
+
+
+def _shard_for(user_id: str) -> int:
+    """Index of the cache shard (and lock) holding this user's entries."""
+    return hash(user_id) & (_CACHE_SHARDS - 1)
 
 
 def cache_calendar_data(func: Callable) -> Callable:
@@ -25,7 +109,9 @@ def cache_calendar_data(func: Callable) -> Callable:
     Decorator to cache calendar reminder data for 5 minutes.
 
     Cache key includes user_id, year, and month to ensure proper isolation.
-    Thread-safe using lock to prevent race conditions.
+    Thread-safe using the user's shard lock to prevent race conditions.
+    Concurrent misses for the same key wait for the first caller's result
+    (or exception) instead of each running the query.
 
     Usage:
         @cache_calendar_data
@@ -37,18 +123,38 @@ def cache_calendar_data(func: Callable) -> Callable:
     def wrapper(user_id: str, year: int, month: int) -> Any:
         # Create unique cache key
         cache_key = f"calendar:{user_id}:{year}:{month}"
-
-        # Try to get from cache (thread-safe)
-        with _cache_lock:
-            if cache_key in _calendar_cache:
-                return _calendar_cache[cache_key]
+        shard = _shard_for(user_id)
+        cache = _calendar_shards[shard]
+        lock = _shard_locks[shard]
+        inflight = _inflight_shards[shard]
+
+        # Try to get from cache, or join a fetch already in progress (thread-safe)
+        with lock:
+            cached = cache.get(cache_key, _MISS)
+            if cached is not _MISS:
+                return cached
+            future = inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = inflight[cache_key] = Future()
+
+        if not leader:
+            return future.result()
 
         # Not in cache - call the function
-        result = func(user_id, year, month)
-
-        # Store in cache (thread-safe)
-        with _cache_lock:
-            _calendar_cache[cache_key] = result
+        try:
+            result = func(user_id, year, month)
+        except BaseException as exc:
+            with lock:
+                del inflight[cache_key]
+            future.set_exception(exc)
+            raise
+
+        # Store in cache (thread-safe), then release any waiters
+        with lock:
+            cache.add(user_id, cache_key, result)
+            del inflight[cache_key]
+        future.set_result(result)
 
         return result
 
@@ -68,14 +174,12 @@ def invalidate_user_calendar_cache(user_id: str) -> None:
     Args:
         user_id: UUID of the user whose cache should be cleared
     """
-    with _cache_lock:
-        # Find and remove all keys for this user
-        keys_to_remove = [
-            key for key in _calendar_cache.keys()
-            if key.startswith(f"calendar:{user_id}:")
-        ]
-        for key in keys_to_remove:
-            del _calendar_cache[key]
+    shard = _shard_for(user_id)
+    cache = _calendar_shards[shard]
+    with _shard_locks[shard]:
+        # Remove all keys for this user via the shard's per-user index
+        for key in list(cache.user_keys.get(user_id, ())):
+            cache.pop(key)
 
 
 def clear_all_calendar_cache() -> None:
@@ -87,5 +191,6 @@ def clear_all_calendar_cache() -> None:
     - Manual cache invalidation
     - System maintenance
     """
-    with _cache_lock:
-        _calendar_cache.clear()
+    for cache, lock in zip(_calendar_shards, _shard_locks):
+        with lock:
+            cache.clear()
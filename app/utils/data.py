@@ -5,13 +5,18 @@ Shared utilities for loading JSON data files from app/data/.
 from __future__ import annotations
 import json
 import os
+from functools import lru_cache
 
 _DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 
 
+@lru_cache(maxsize=32)
 def load_data_file(filename: str) -> list:
     """Load a JSON data file from app/data/.
 
+    Each file is read and parsed once per process; later calls return the
+    same object, so callers must treat it as read-only.
+
     Returns an empty list if the file is not found.
     """
     filepath = os.path.join(_DATA_DIR, filename)
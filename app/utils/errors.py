@@ -10,6 +10,7 @@ Provides consistent error handling across the application:
 from __future__ import annotations
 from typing import Tuple
 from flask import current_app
+import itertools
 import logging
 
 # User-friendly generic error messages
@@ -22,6 +23,11 @@ GENERIC_MESSAGES = {
     "network": "Network error occurred. Please check your connection and try again.",
 }
 
+# Counts unexpected errors so tracebacks can be sampled (see
+# ERROR_TRACEBACK_SAMPLE_EVERY); formatting every traceback is costly
+# when one failure repeats on every request.
+_error_counter = itertools.count()
+
 
 def sanitize_error(
     error: Exception,
@@ -58,17 +64,17 @@ def sanitize_error(
         # These are expected errors (user mistakes), log as info
         current_app.logger.info(f"Expected error - {log_message}")
     else:
-        # Unexpected errors (bugs, system issues), log as error with stack trace
-        current_app.logger.error(f"Unexpected error - {log_message}", exc_info=True)
+        # Unexpected errors (bugs, system issues), log as error with a
+        # sampled stack trace (the first error always gets one)
+        every = current_app.config.get("ERROR_TRACEBACK_SAMPLE_EVERY", 1)
+        with_traceback = every <= 1 or next(_error_counter) % every == 0
+        current_app.logger.error(f"Unexpected error - {log_message}", exc_info=with_traceback)
 
     # Return sanitized user-friendly message
     return GENERIC_MESSAGES.get(error_type, GENERIC_MESSAGES["database"])
 
 
-def handle_service_error(
-    result: Tuple[any, str | None],
-    success_data_index: int = 0
-) -> Tuple[any, str]:
+def handle_service_error(result: Tuple[any, str | None]) -> Tuple[any, str]:
     """
     Handle service layer errors consistently.
 
@@ -77,7 +83,6 @@ def handle_service_error(
 
     Args:
         result: Tuple of (data, error_message) from service function
-        success_data_index: Index of success data in tuple (usually 0)
 
     Returns:
         Tuple of (data, sanitized_error_or_none)
@@ -88,12 +93,11 @@ def handle_service_error(
         >>> if error:
         ...     flash(error, "error")
     """
-    data = result[success_data_index]
-    error = result[1] if len(result) > 1 else None
+    data, error = result
 
     if error:
         # Log original error, return sanitized message
-        current_app.logger.error(f"Service error: {error}")
+        current_app.logger.error("Service error: %s", error)
         return data, GENERIC_MESSAGES["database"]
 
     return data, None
@@ -12,11 +12,30 @@ from __future__ import annotations
 from typing import Tuple, Optional
 from PIL import Image
 from io import BytesIO
-import os
 
 # Security: Allowed image file extensions
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 
+# Security: Executable/script extensions rejected as the second-to-last
+# extension (double extension attacks like 'image.php.jpg')
+DANGEROUS_EXTENSIONS = frozenset({
+    'php', 'phtml', 'php3', 'php4', 'php5',
+    'exe', 'sh', 'bat', 'cmd', 'com',
+    'js', 'py', 'rb', 'pl', 'cgi',
+    'asp', 'aspx', 'jsp'
+})
+
+# Security: Leading bytes (magic numbers) of the allowed image formats.
+# WebP is "RIFF" + 4-byte size + "WEBP", checked separately.
+_IMAGE_SIGNATURES = (
+    b'\x89PNG\r\n\x1a\n',  # PNG
+    b'\xff\xd8\xff',         # JPEG
+    b'GIF87a', b'GIF89a',    # GIF
+)
+
+# Security: PIL format names accepted as uploaded images
+_ALLOWED_IMAGE_FORMATS = frozenset({'PNG', 'JPEG', 'GIF', 'WEBP'})
+
 # Security: Maximum file size (5MB)
 MAX_FILE_SIZE = 5 * 1024 * 1024
 
@@ -52,23 +71,14 @@ def allowed_file(filename: str) -> bool:
         return False
 
     # Get final extension
-    ext = filename.rsplit('.', 1)[1].lower()
-    if ext not in ALLOWED_EXTENSIONS:
+    parts = filename.lower().split('.')
+    if parts[-1] not in ALLOWED_EXTENSIONS:
         return False
 
     # Security: Check for double extension attack (e.g., image.php.jpg)
     # Count dots - if more than 1, check second-to-last extension isn't dangerous
-    parts = filename.lower().split('.')
-    if len(parts) > 2:
-        # Check second-to-last extension isn't a dangerous executable type
-        dangerous_exts = {
-            'php', 'phtml', 'php3', 'php4', 'php5',
-            'exe', 'sh', 'bat', 'cmd', 'com',
-            'js', 'py', 'rb', 'pl', 'cgi',
-            'asp', 'aspx', 'jsp'
-        }
-        if parts[-2] in dangerous_exts:
-            return False
+    if len(parts) > 2 and parts[-2] in DANGEROUS_EXTENSIONS:
+        return False
 
     return True
 
@@ -78,7 +88,10 @@ def validate_image_content(file_bytes: bytes) -> bool:
     Validate that file content is actually a valid image.
 
     Security: This prevents malicious files with spoofed extensions by checking
-    the actual file content (magic numbers/file signature) using PIL.
+    the actual file content. The file signature (magic number) must be PNG,
+    JPEG, GIF or WebP, which rejects non-images without touching PIL; files
+    that pass must also parse as one of those formats in PIL. Only the header
+    is read here - full decoding happens when the photo versions are built.
 
     Args:
         file_bytes: The file content as bytes
@@ -93,10 +106,16 @@ def validate_image_content(file_bytes: bytes) -> bool:
         >>> validate_image_content(b'<script>alert("xss")</script>')
         False
     """
+    if not file_bytes:
+        return False
+    is_webp = file_bytes[:4] == b'RIFF' and file_bytes[8:12] == b'WEBP'
+    if not (is_webp or file_bytes.startswith(_IMAGE_SIGNATURES)):
+        return False
+
     try:
-        img = Image.open(BytesIO(file_bytes))
-        img.verify()  # Verify it's a valid image
-        return True
+        with Image.open(BytesIO(file_bytes)) as img:
+            # Image.open only parses the header; no pixel data is decoded
+            return img.format in _ALLOWED_IMAGE_FORMATS
     except Exception:
         return False
 
@@ -140,17 +159,16 @@ def validate_upload_file(
     if not allowed_file(file.filename):
         return False, "Invalid file type. Only images (PNG, JPG, GIF, WebP) are allowed.", None
 
+    # Read file content, bounded: never buffer more than one byte past the
+    # limit, and don't depend on the stream supporting seek-to-end
+    file.seek(0)
+    file_bytes = file.read(max_size + 1)
+
     # Check file size
-    file.seek(0, os.SEEK_END)
-    file_length = file.tell()
-    if file_length > max_size:
+    if len(file_bytes) > max_size:
         max_mb = max_size / (1024 * 1024)
         return False, f"Photo must be less than {max_mb:.0f}MB.", None
 
-    # Read file content
-    file.seek(0)
-    file_bytes = file.read()
-
     # Validate actual file content (prevents malicious files with spoofed extensions)
     if not validate_image_content(file_bytes):
         return False, "Invalid image file. Please upload a valid image.", None
@@ -6,6 +6,35 @@ Keeps filter logic out of the app factory so it can be unit-tested easily.
 
 from __future__ import annotations
 from datetime import date, datetime
+from functools import lru_cache
+
+from flask import g, has_request_context
+
+
+def _today() -> date:
+    """Return today's date, computed at most once per request.
+
+    Outside a request (e.g. unit tests) this is just date.today().
+    """
+    if not has_request_context():
+        return date.today()
+    today = g.get("today")
+    if today is None:
+        today = g.today = date.today()
+    return today
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date | None:
+    """Parse an ISO date/datetime string to a date, or None if unparseable.
+
+    Cached because list pages render the same timestamps many times.
+    """
+    try:
+        # Handle ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
 
 
 def relative_date(value):
@@ -15,15 +44,14 @@ def relative_date(value):
 
     # Parse string to date if needed
     if isinstance(value, str):
-        try:
-            # Handle ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
-            value = datetime.fromisoformat(value.replace("Z", "+00:00")).date()
-        except (ValueError, AttributeError):
-            return value[:10] if len(value) >= 10 else value
+        parsed = _parse_date(value)
+        if parsed is None:
+            return value[:10]
+        value = parsed
     elif isinstance(value, datetime):
         value = value.date()
 
-    today = date.today()
+    today = _today()
     delta = (today - value).days
 
     if delta == 0:
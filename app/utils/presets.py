@@ -4,6 +4,8 @@ longitude or city keywords, and returns a small curated set of plant presets
 for the inferred region.
 """
 
+import re
+
 def infer_region_from_latlon(lat: float, lon: float) -> str:
     """Approximate climate bands by absolute latitude."""
     abslat = abs(lat)
@@ -12,14 +14,25 @@ def infer_region_from_latlon(lat: float, lon: float) -> str:
     if abslat < 45:   return "temperate"
     return "cool"
 
+# City keywords per region, checked in this order (first region with any
+# keyword in the city wins). Each region's keywords compile to one regex.
+_CITY_REGION_KEYWORDS = (
+    ("tropical", ("miami","honolulu","hilo","key west")),
+    ("warm", ("los angeles","san diego","phoenix","austin","las vegas","orlando","tampa")),
+    ("temperate", ("seattle","portland","denver","kansas city","st louis","chicago","new york","boston")),
+    ("cool", ("minneapolis","anchorage","calgary","winnipeg")),
+)
+_CITY_REGION_PATTERNS = tuple(
+    (region, re.compile("|".join(map(re.escape, keywords))))
+    for region, keywords in _CITY_REGION_KEYWORDS
+)
+
 def infer_region_from_city(city: str | None) -> str:
     """Map common city names to regions using simple keyword checks."""
     if not city: return "temperate"
     c = city.lower()
-    if any(k in c for k in ("miami","honolulu","hilo","key west")): return "tropical"
-    if any(k in c for k in ("los angeles","san diego","phoenix","austin","las vegas","orlando","tampa")): return "warm"
-    if any(k in c for k in ("seattle","portland","denver","kansas city","st louis","chicago","new york","boston")): return "temperate"
-    if any(k in c for k in ("minneapolis","anchorage","calgary","winnipeg")): return "cool"
+    for region, pattern in _CITY_REGION_PATTERNS:
+        if pattern.search(c): return region
     return "temperate"
 
 PRESET_LIBRARY = {
@@ -9,18 +9,90 @@ downstream processing.
 from __future__ import annotations
 import html
 import re
+import string
+from functools import lru_cache, partial
 from typing import Any, Dict, Tuple
+from flask import request
+
+# Allowlist for plant/city names: letters, numbers, whitespace and common
+# lightweight punctuation; odd control/symbol characters are dropped.
+# Matches the runs of whitespace and/or disallowed characters that need work
+# (any disallowed character, or 2+ whitespace); each run is cleaned by
+# _clean_name_run, so filtering and whitespace collapsing share one scan.
+_NAME_CLEANUP_PATTERN = re.compile(
+    r"\s*[^a-zA-Z0-9\s\-\.,'()/&][^a-zA-Z0-9\-\.,'()/&]*|\s{2,}"
+)
+
+# ASCII-only equivalent: a str.translate table deleting every disallowed
+# ASCII character (whitespace is kept), followed by whitespace collapsing
+_NAME_ALLOWED_ASCII = frozenset(string.ascii_letters + string.digits + "-.,'()/&")
+_NAME_ASCII_DELETE_TABLE = dict.fromkeys(
+    i for i in range(128) if chr(i) not in _NAME_ALLOWED_ASCII and not chr(i).isspace()
+)
+_REPEATED_WHITESPACE_PATTERN = re.compile(r"\s{2,}")
+
+# Used to strip and truncate a field without copying all of it first
+_LEADING_WHITESPACE_PATTERN = re.compile(r"\s*")
+_NON_WHITESPACE_PATTERN = re.compile(r"\S")
+
 
-# Allowlist regex: we REMOVE anything NOT in this set.
-# Includes letters/numbers/space and common lightweight punctuation used in names.
-# This keeps plant/city fields readable while dropping odd control/symbol characters.
+def _keyword_trie_pattern(keywords) -> str:
+    """
+    Build a regex matching any of the keywords, factored by shared prefix.
+
+    The keywords are stored in a trie and emitted as nested alternations
+    (e.g. "on(?:error|load|mouse(?:over|out))"), so the regex engine rejects
+    a position after one character instead of trying every keyword in turn -
+    the same single-pass idea as an Aho-Corasick automaton. Where one keyword
+    is a prefix of another, the longer one wins.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end of keyword
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+# HTML event handlers and script-capable URL schemes stripped from names and
+# locations (XSS protection). Matched case-insensitively in a single pass.
+_DANGEROUS_KEYWORDS = (
+    'onerror', 'onload', 'onclick', 'onmouseover', 'onmouseout',
+    'onmousemove', 'onmousedown', 'onmouseup', 'onfocus', 'onblur',
+    'onchange', 'onsubmit', 'javascript:', 'data:', 'vbscript:'
+)
+_DANGEROUS_PATTERN = re.compile(_keyword_trie_pattern(_DANGEROUS_KEYWORDS), re.IGNORECASE)
+
+# Anything _soft_sanitize would change in an already stripped/truncated value:
+# a dangerous keyword, a character outside the allowlist (other whitespace
+# included), or a double space. Most plant/city names match none of these.
+# Only the keyword part ignores case, so the allowlist stays ASCII-exact.
+_NAME_NEEDS_CLEANUP_PATTERN = re.compile(
+    f"(?i:{_DANGEROUS_PATTERN.pattern})|[^a-zA-Z0-9 \\-\\.,'()/&]|  "
+)
 
-_SAFE_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9\s\-\.,'()/&]+")
+# Question cleanup: str.translate table deleting control characters (keeps
+# \t, \n, \r), and runs of spaces/tabs to collapse
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+)
+_REPEATED_SPACES_PATTERN = re.compile(r"[ \t]{2,}")
+# Anything _soft_sanitize_question would change in a stripped/truncated value
+_QUESTION_NEEDS_CLEANUP_PATTERN = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]|[ \t]{2}")
 
-# UUID validation pattern (RFC 4122 compliant)
+# UUID validation pattern (RFC 4122 compliant), used with fullmatch.
+# Explicit a-f/A-F ranges rather than IGNORECASE keep the match fast.
 _UUID_PATTERN = re.compile(
-    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-    re.IGNORECASE
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
 )
 
 MAX_PLANT_LEN = 80
@@ -31,61 +103,97 @@ MAX_QUESTION_LEN = 1200
 # Import from constants to ensure consistency across the app
 try:
     from app.constants import PLANT_LOCATIONS
-    CARE_CONTEXT_CHOICES = {loc[0] for loc in PLANT_LOCATIONS}
+    CARE_CONTEXT_CHOICES = frozenset(loc[0] for loc in PLANT_LOCATIONS)
 except ImportError:
     # Fallback for tests or if constants module doesn't exist
-    CARE_CONTEXT_CHOICES = {"indoor_potted", "outdoor_potted", "outdoor_bed", "greenhouse", "office"}
+    CARE_CONTEXT_CHOICES = frozenset(("indoor_potted", "outdoor_potted", "outdoor_bed", "greenhouse", "office"))
+
+_DEFAULT_CARE_CONTEXT = "indoor_potted"
+
 
+def _clean_name_run(match: re.Match) -> str:
+    """Drop disallowed characters from a run; 2+ whitespace left collapse to one space."""
+    run = match.group()
+    spaces = [c for c in run if c.isspace()]
+    if len(spaces) > 1:
+        return " "
+    return spaces[0] if spaces else ""
 
-def _soft_sanitize(text: str, max_len: int) -> str:
+
+def _strip_and_truncate(text: str | None, max_len: int) -> str:
     """
-    Normalizes names/locations:
-    - strip whitespace
-    - bound length
-    - remove dangerous HTML event handlers and keywords
-    - remove disallowed characters via allowlist
-    - collapse double spaces
+    Same result as (text or "").strip()[:max_len], without copying the whole
+    value first: at most max_len characters are copied, so an oversized
+    submission costs no more than one within the limit.
     """
-    t = (text or "").strip()
-    if not t:
+    if not text:
         return ""
-    t = t[:max_len]
-
-    # Remove HTML event handlers and dangerous keywords (XSS protection)
-    dangerous_keywords = [
-        'onerror', 'onload', 'onclick', 'onmouseover', 'onmouseout',
-        'onmousemove', 'onmousedown', 'onmouseup', 'onfocus', 'onblur',
-        'onchange', 'onsubmit', 'javascript:', 'data:', 'vbscript:'
-    ]
-    for keyword in dangerous_keywords:
-        t = re.sub(keyword, '', t, flags=re.IGNORECASE)
-
-    # Remove disallowed characters via allowlist
-    t = _SAFE_CHARS_PATTERN.sub("", t)
-    t = re.sub(r"\s{2,}", " ", t)
+    start = _LEADING_WHITESPACE_PATTERN.match(text).end()
+    t = text[start:start + max_len]
+    # Trailing whitespace survives the cut only if more text follows it
+    if t[-1:].isspace() and not _NON_WHITESPACE_PATTERN.search(text, start + max_len):
+        t = t.rstrip()
     return t
 
 
-def _soft_sanitize_question(text: str, max_len: int) -> str:
+def _sanitize(text: str | None, max_len: int, needs_cleanup: re.Pattern, clean) -> str:
     """
-    Question field is a bit more permissive:
-    - strip & bound length
-    - remove control chars only; keep reasonable punctuation
-    - normalize repeated tabs/spaces
+    Shared skeleton of the field sanitizers: strip and bound the value, then
+    run clean() on it only if needs_cleanup finds something to change.
     """
-    t = (text or "").strip()
-    if not t:
-        return ""
-    t = t[:max_len]
-    t = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", t)
-    t = re.sub(r"[ \t]{2,}", " ", t)
-    return t
+    t = _strip_and_truncate(text, max_len)
+
+    # Fast path: nothing to remove or collapse
+    if not t or not needs_cleanup.search(t):
+        return t
+    return clean(t)
+
+
+@lru_cache(maxsize=2048)
+def _clean_name(t: str) -> str:
+    """Cleanup half of _soft_sanitize (pure; cached since users resubmit the same values)."""
+    # Remove HTML event handlers and dangerous keywords (XSS protection).
+    # Repeat until nothing matches so removals can't splice a new keyword
+    # together (e.g. "ononloadload").
+    removed = 1
+    while removed:
+        t, removed = _DANGEROUS_PATTERN.subn("", t)
+
+    # Remove disallowed characters via allowlist and collapse double spaces
+    if t.isascii():
+        return _REPEATED_WHITESPACE_PATTERN.sub(" ", t.translate(_NAME_ASCII_DELETE_TABLE))
+    return _NAME_CLEANUP_PATTERN.sub(_clean_name_run, t)
+
+
+@lru_cache(maxsize=256)
+def _clean_question(t: str) -> str:
+    """Cleanup half of _soft_sanitize_question (pure; cached for retried questions)."""
+    t = t.translate(_CONTROL_CHARS_TABLE)
+    return _REPEATED_SPACES_PATTERN.sub(" ", t)
+
+
+# Normalizes names/locations:
+# - strip whitespace
+# - bound length
+# - remove dangerous HTML event handlers and keywords
+# - remove disallowed characters via allowlist
+# - collapse double spaces
+_soft_sanitize = partial(_sanitize, needs_cleanup=_NAME_NEEDS_CLEANUP_PATTERN, clean=_clean_name)
+
+# Question field is a bit more permissive:
+# - strip & bound length
+# - remove control chars only; keep reasonable punctuation
+# - normalize repeated tabs/spaces
+_soft_sanitize_question = partial(_sanitize, needs_cleanup=_QUESTION_NEEDS_CLEANUP_PATTERN, clean=_clean_question)
 
 
 def normalize_context(value: str | None) -> str:
     """Coerce unknown/missing values to the default option."""
+    # Select values normally arrive exactly as rendered in the form
+    if value in CARE_CONTEXT_CHOICES:
+        return value
     v = (value or "").strip().lower()
-    return v if v in CARE_CONTEXT_CHOICES else "indoor_potted"
+    return v if v in CARE_CONTEXT_CHOICES else _DEFAULT_CARE_CONTEXT
 
 
 def display_sanitize_short(text: str) -> str:
@@ -95,7 +203,9 @@ def display_sanitize_short(text: str) -> str:
     """
     if not text:
         return ""
-    t = html.escape(text)
+    # Escaping never shortens text, so only the first 241 characters can
+    # affect the result. html.escape returns clean text as-is (no copy).
+    t = html.escape(text[:241])
     return (t[:240] + "…") if len(t) > 240 else t
 
 
@@ -113,8 +223,14 @@ def validate_inputs(form: Dict[str, Any]) -> Tuple[Dict[str, Any], str | None]:
     raw_question = form.get("question", "")
     raw_context = form.get("care_context", "")
 
-    plant = _soft_sanitize(raw_plant, MAX_PLANT_LEN)
-    city = _soft_sanitize(raw_city, MAX_CITY_LEN)
+    plant = _strip_and_truncate(raw_plant, MAX_PLANT_LEN)
+    city = _strip_and_truncate(raw_city, MAX_CITY_LEN)
+    # Usually both names are already clean: check them in one scan. Anything
+    # found in either field is found in the joined string, so a clean result
+    # is exact; a match just falls back to sanitizing each raw field.
+    if _NAME_NEEDS_CLEANUP_PATTERN.search(f"{plant}/{city}"):
+        plant = _soft_sanitize(raw_plant, MAX_PLANT_LEN)
+        city = _soft_sanitize(raw_city, MAX_CITY_LEN)
     question = _soft_sanitize_question(raw_question, MAX_QUESTION_LEN)
     care_context = normalize_context(raw_context)
 
@@ -129,6 +245,47 @@ def validate_inputs(form: Dict[str, Any]) -> Tuple[Dict[str, Any], str | None]:
     }, None
 
 
+# Tuple copy of app.routes.auth.ALLOWED_REDIRECT_PREFIXES for str.startswith,
+# loaded on first use (importing the auth routes at module level is circular)
+_redirect_prefixes: Tuple[str, ...] | None = None
+
+
+def _allowed_redirect_prefixes() -> Tuple[str, ...]:
+    """Return the redirect whitelist as a tuple, importing it once."""
+    global _redirect_prefixes
+    if _redirect_prefixes is None:
+        from app.routes.auth import ALLOWED_REDIRECT_PREFIXES
+        _redirect_prefixes = tuple(ALLOWED_REDIRECT_PREFIXES)
+    return _redirect_prefixes
+
+
+def _split_referrer(url: str) -> Tuple[str, str]:
+    """
+    Split a Referer URL into (netloc, path), ignoring any query/fragment.
+
+    Covers only what safe_referrer_or needs, without building a full
+    urlparse() result. Anything other than an http(s) URL or a "/"-rooted
+    path yields an empty path, which the caller rejects.
+    """
+    for sep in "?#":
+        cut = url.find(sep)
+        if cut >= 0:
+            url = url[:cut]
+
+    if url.startswith("/"):
+        return "", url
+
+    scheme_end = url.find("://")
+    if scheme_end < 0 or url[:scheme_end].lower() not in ("http", "https"):
+        return "", ""
+
+    netloc_start = scheme_end + 3
+    path_start = url.find("/", netloc_start)
+    if path_start < 0:
+        return url[netloc_start:], ""
+    return url[netloc_start:path_start], url[path_start:]
+
+
 def safe_referrer_or(fallback: str) -> str:
     """Return request.referrer if it points back to this app, otherwise fallback.
 
@@ -136,28 +293,22 @@ def safe_referrer_or(fallback: str) -> str:
     same-origin, path-only URL matching allowed prefixes.  Reuses the
     ``ALLOWED_REDIRECT_PREFIXES`` whitelist from ``app.routes.auth``.
     """
-    from flask import request
-    from urllib.parse import urlparse
-
     referrer = request.referrer
     if not referrer:
         return fallback
 
-    parsed = urlparse(referrer)
+    netloc, path = _split_referrer(referrer)
 
     # If the referrer has a host, it must match the current request host
-    if parsed.netloc and parsed.netloc != request.host:
+    if netloc and netloc != request.host:
         return fallback
 
-    path = parsed.path or ""
-
     # Must start with / but not // (protocol-relative)
     if not path.startswith("/") or path.startswith("//"):
         return fallback
 
     # Must match one of the allowed prefixes (same whitelist as auth.py)
-    from app.routes.auth import ALLOWED_REDIRECT_PREFIXES
-    if not any(path.startswith(prefix) for prefix in ALLOWED_REDIRECT_PREFIXES):
+    if not path.startswith(_allowed_redirect_prefixes()):
         return fallback
 
     return referrer
@@ -181,4 +332,4 @@ def is_valid_uuid(value: str | None) -> bool:
     """
     if not value or not isinstance(value, str):
         return False
-    return bool(_UUID_PATTERN.match(value))
\ No newline at end of file
+    return _UUID_PATTERN.fullmatch(value) is not None
\ No newline at end of file
@@ -3,6 +3,9 @@ Local development entry point.
 
 Creates the Flask app via create_app() and runs the dev server. Keeps startup
 simple and avoids embedding app logic here.
+
+Set USE_GUNICORN=1 to serve through Gunicorn with the same worker settings
+as production (see wsgi.py / Procfile), plus --reload for local edits.
 """
 
 import os
@@ -14,5 +17,12 @@ os.environ.setdefault("APP_CONFIG", "app.config.DevConfig")
 app = create_app()
 
 if __name__ == "__main__":
+    port = int(os.getenv("PORT", 5000))
+    if os.getenv("USE_GUNICORN") == "1":
+        # Replace this process with Gunicorn; APP_CONFIG above is inherited
+        os.execvp("gunicorn", [
+            "gunicorn", "-w", "2", "-k", "gthread", "-b", f"0.0.0.0:{port}",
+            "--reload", "wsgi:app",
+        ])
     # Use host='0.0.0.0' so it’s reachable on LAN (e.g., for testing on mobile)
-    app.run(host="0.0.0.0", port=int(os.getenv("PORT", 5000)), debug=os.getenv("FLASK_DEBUG", "1") == "1")
+    app.run(host="0.0.0.0", port=port, debug=os.getenv("FLASK_DEBUG", "1") == "1")